@@ -11,35 +11,144 @@ Key Features:
 - Minimal setup ready for AI and job application features
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 import os
 import json
-import smtplib
+import re
+import logging
+import orjson
+import asyncio
+import base64
+import hashlib
+import mmap
+import threading
+import uuid
+import aiosmtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 import google.generativeai as genai
-from pydantic import BaseModel
-from typing import List, Optional
+from google.api_core.exceptions import ResourceExhausted
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential, wait_exponential_jitter
+from cachetools import LRUCache, TTLCache
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, constr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Literal, Optional, Tuple
 import io
-import PyPDF2
-from docx import Document
+import zipfile
+import xml.etree.ElementTree as ET
+import pypdfium2
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+class Settings(BaseSettings):
+    """
+    Application configuration, read from the environment and validated once.
+
+    Credentials stay optional so the API can start without them (the
+    affected endpoints report what is missing), but values that are set
+    must be well-formed: a malformed Gmail address or App Password fails
+    at import time instead of on every /send_email call. Empty values
+    (e.g. ``GMAIL_USER=`` left blank in .env) count as unset.
+    """
+    model_config = SettingsConfigDict(extra="ignore", env_ignore_empty=True)
+
+    gemini_api_key: Optional[str] = None
+    gemini_model_name: str = "gemini-2.5-flash"
+    gmail_user: Optional[EmailStr] = None
+    gmail_app_password: Optional[constr(min_length=16, max_length=16)] = None
+    resume_file_path: Optional[str] = None
+    # Gmail allows roughly 15 concurrent sessions per account
+    smtp_pool_size: int = Field(5, ge=1, le=10)
+    max_upload_bytes: int = Field(10 * 1024 * 1024, gt=0)
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def upper_case_log_level(cls, value):
+        """Accept LOG_LEVEL in any case (e.g. "debug")."""
+        return value.upper() if isinstance(value, str) else value
+
+    @field_validator("gmail_app_password", mode="before")
+    @classmethod
+    def strip_app_password_spaces(cls, value):
+        """Google displays App Passwords in groups of four; accept them pasted as shown."""
+        return value.replace(" ", "") if isinstance(value, str) else value
+
+settings = Settings()
+
+# Configure logging once; per-request diagnostics are DEBUG and are only
+# formatted when LOG_LEVEL=DEBUG
+logging.basicConfig(level=settings.log_level)
+
 # Configure Gemini AI with API key from environment
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_API_KEY = settings.gemini_api_key
 if GEMINI_API_KEY:
     genai.configure(api_key=GEMINI_API_KEY)
 
+# Build the Gemini model once and share it across requests; every endpoint
+# calls it through generate_gemini_content()
+GEMINI_MODEL_NAME = settings.gemini_model_name
+GEMINI_MODEL = genai.GenerativeModel(GEMINI_MODEL_NAME) if GEMINI_API_KEY else None
+
+# Upper bound on Gemini calls in flight at once; excess callers queue here
+# instead of bursting past the API quota
+GEMINI_MAX_CONCURRENCY = 20
+_gemini_semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+
+# In-process caches for repeated Gemini requests (identical searches/letters)
+GEMINI_CACHE_TTL = 3600  # seconds
+_job_search_cache = TTLCache(maxsize=1024, ttl=GEMINI_CACHE_TTL)
+_cover_letter_cache = TTLCache(maxsize=1024, ttl=GEMINI_CACHE_TTL)
+_subject_cache = TTLCache(maxsize=512, ttl=GEMINI_CACHE_TTL)
+_inflight_gemini_calls: Dict[Hashable, asyncio.Task] = {}
+
+# Upper bound on queries answered by a single batched Gemini prompt
+MAX_BATCH_QUERIES = 16
+
+# Dynamic micro-batching of concurrent /search_jobs requests
+SEARCH_BATCH_WINDOW = 0.05  # seconds to wait for more requests after the first
+SEARCH_BATCH_MAX_SIZE = MAX_BATCH_QUERIES
+_job_search_queue: Optional[asyncio.Queue] = None
+_job_search_batcher: Optional[asyncio.Task] = None
+_job_search_dispatches: set = set()
+
 # Email configuration from environment
-GMAIL_USER = os.getenv("GMAIL_USER")
-GMAIL_APP_PASSWORD = os.getenv("GMAIL_APP_PASSWORD")
-RESUME_FILE_PATH = os.getenv("RESUME_FILE_PATH")
+GMAIL_USER = settings.gmail_user
+GMAIL_APP_PASSWORD = settings.gmail_app_password
+RESUME_FILE_PATH = settings.resume_file_path
+
+# Largest document /extract_text and /get_file_text will load into memory
+MAX_UPLOAD_BYTES = settings.max_upload_bytes
+UPLOAD_READ_CHUNK = 64 * 1024
+
+# Extracted document text keyed by (content digest, extractor); the same
+# resume is read on every UI action, so repeats skip parsing entirely
+_EXTRACTED_TEXT_CACHE = LRUCache(maxsize=32)
+
+# Persistent Gmail SMTP connection pool, sized by SMTP_POOL_SIZE (1-10)
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 587
+SMTP_POOL_SIZE = settings.smtp_pool_size
+GMAIL_MAX_RECIPIENTS = 100  # Gmail rejects messages with more RCPT TO commands
+SMTP_KEEPALIVE_INTERVAL = 60  # seconds between NOOPs on idle pooled connections
+_smtp_pool: Optional[asyncio.Queue] = None
+_smtp_keepalive: Optional[asyncio.Task] = None
+
+# Status of /send_email/background jobs by task id, kept for an hour
+_email_tasks = TTLCache(maxsize=1024, ttl=3600)
+
+# Base64-encoded attachments keyed by absolute path, stamped with (mtime, size).
+# Bounded, and locked because _build_mime runs in worker threads.
+ATTACHMENT_CACHE_SIZE = 8
+_ATTACHMENT_CACHE: LRUCache = LRUCache(maxsize=ATTACHMENT_CACHE_SIZE)
+_ATTACHMENT_CACHE_LOCK = threading.Lock()
 
 # Pydantic models for request/response
 class JobSearchRequest(BaseModel):
@@ -56,12 +165,24 @@ class JobPosting(BaseModel):
     emails: str
     phone: str
 
+# Validates a whole decoded job list in one pydantic-core call
+_JOB_LIST_ADAPTER = TypeAdapter(List[JobPosting])
+
+class JobSearchBatchRequest(BaseModel):
+    """Request model for answering several job searches in one call."""
+    queries: List[JobSearchRequest]
+
 class CoverLetterRequest(BaseModel):
     """Request model for cover letter generation."""
     job_title: str
     company: str
     resume_text: str
 
+class ApplyPrepRequest(BaseModel):
+    """Request model for preparing a job search and cover letter together."""
+    search: JobSearchRequest
+    cover: CoverLetterRequest
+
 class EmailRequest(BaseModel):
     """Request model for sending job application emails."""
     to_emails: List[str]
@@ -80,18 +201,181 @@ class SubjectGenerationRequest(BaseModel):
 app = FastAPI(
     title="JobAI Applier MVP",
     description="AI-powered job application automation tool",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware to allow frontend requests
+# Origins allowed to call the API: the frontend servers only. Pages opened
+# from file:// send Origin "null", but so do sandboxed iframes on any site,
+# so it is not allowed alongside credentials; serve the frontend with
+# serve_frontend.py instead. No "*" wildcard: it is invalid alongside
+# allow_credentials, and without it (or an origin regex) Starlette checks
+# each request's origin with a single set lookup.
+ALLOWED_ORIGINS = frozenset([
+    "http://localhost:8080",
+    "http://127.0.0.1:8080",
+    "http://localhost:8081",
+    "http://127.0.0.1:8081",
+])
+
+# Add CORS middleware to allow frontend requests. The frontend only sends
+# JSON and form uploads, so an explicit header allowlist avoids reflecting
+# arbitrary request headers, and browsers may cache preflights for a day.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:8080", "http://127.0.0.1:8080", "http://localhost:8081", "http://127.0.0.1:8081", "*"],  # Frontend servers and file:// access
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,
 )
 
+@app.on_event("startup")
+async def report_missing_configuration():
+    """
+    Warn once at startup about features that are unavailable.
+
+    Malformed values already fail Settings validation at import; missing
+    ones are allowed, so say up front which endpoints will refuse requests
+    instead of leaving it to the first call.
+    """
+    if not GEMINI_API_KEY:
+        logger.warning("GEMINI_API_KEY is not set: job search, cover letter and subject endpoints will fail")
+    if not GMAIL_USER or not GMAIL_APP_PASSWORD:
+        logger.warning("GMAIL_USER/GMAIL_APP_PASSWORD are not set: /send_email will fail")
+    if RESUME_FILE_PATH and not os.path.exists(RESUME_FILE_PATH):
+        logger.warning("RESUME_FILE_PATH does not exist: %s", RESUME_FILE_PATH)
+
+async def _open_smtp_connection() -> aiosmtplib.SMTP:
+    """
+    Open a Gmail SMTP connection that is ready to send mail.
+
+    Returns:
+        aiosmtplib.SMTP: Connection that has completed STARTTLS and login
+
+    Raises:
+        aiosmtplib.SMTPException: If the TLS handshake or authentication fails
+    """
+    logger.debug("Connecting to Gmail SMTP")
+    server = aiosmtplib.SMTP(hostname=SMTP_HOST, port=SMTP_PORT, timeout=30, start_tls=False)
+    await server.connect()
+    try:
+        logger.debug("Starting TLS")
+        await server.starttls()
+
+        logger.debug("Attempting SMTP login")
+        await server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
+        logger.debug("SMTP authentication successful")
+    except Exception:
+        server.close()
+        raise
+
+    return server
+
+async def _close_smtp_connection(server: Optional[aiosmtplib.SMTP]) -> None:
+    """Politely close a pooled SMTP connection, ignoring network errors."""
+    if server is None:
+        return
+    try:
+        await server.quit()
+    except (aiosmtplib.SMTPException, OSError):
+        server.close()
+
+async def _smtp_connection_alive(server: aiosmtplib.SMTP) -> bool:
+    """Check a pooled connection with a lightweight NOOP before reusing it."""
+    if not server.is_connected:
+        return False
+    try:
+        response = await server.noop()
+    except (aiosmtplib.SMTPException, OSError):
+        return False
+    return response.code == 250
+
+@app.on_event("startup")
+async def open_smtp_pool():
+    """
+    Pre-authenticate a pool of Gmail SMTP connections.
+
+    Each pool slot holds either a logged-in connection or ``None``; empty
+    slots are (re)connected on checkout, so a startup without credentials
+    or network access still serves requests once the problem is fixed.
+    """
+    global _smtp_pool
+    _smtp_pool = asyncio.Queue(maxsize=SMTP_POOL_SIZE)
+
+    servers = [None] * SMTP_POOL_SIZE
+    if GMAIL_USER and GMAIL_APP_PASSWORD:
+        results = await asyncio.gather(
+            *(_open_smtp_connection() for _ in range(SMTP_POOL_SIZE)),
+            return_exceptions=True
+        )
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.warning("Could not pre-open SMTP connection: %s", result)
+            else:
+                servers[i] = result
+
+    for server in servers:
+        _smtp_pool.put_nowait(server)
+
+    global _smtp_keepalive
+    _smtp_keepalive = asyncio.create_task(keep_smtp_pool_alive())
+
+async def keep_smtp_pool_alive() -> None:
+    """
+    Periodically NOOP idle pooled connections so Gmail doesn't drop them.
+
+    Every SMTP_KEEPALIVE_INTERVAL seconds each idle connection is checked;
+    one that has been disconnected is reconnected here, in the background,
+    rather than making the next /send_email pay for the handshake.
+    """
+    while True:
+        await asyncio.sleep(SMTP_KEEPALIVE_INTERVAL)
+        for _ in range(_smtp_pool.qsize()):
+            try:
+                server = _smtp_pool.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                if server is not None and not await _smtp_connection_alive(server):
+                    await _close_smtp_connection(server)
+                    server = None
+                    try:
+                        server = await _open_smtp_connection()
+                    except (aiosmtplib.SMTPException, OSError) as e:
+                        logger.warning("Could not reconnect idle SMTP connection: %s", e)
+            finally:
+                _smtp_pool.put_nowait(server)
+
+@app.on_event("shutdown")
+async def close_smtp_pool():
+    """Close every pooled SMTP connection."""
+    if _smtp_keepalive is not None:
+        _smtp_keepalive.cancel()
+    while _smtp_pool is not None and not _smtp_pool.empty():
+        await _close_smtp_connection(_smtp_pool.get_nowait())
+
+async def _acquire_smtp_connection() -> aiosmtplib.SMTP:
+    """
+    Check out a healthy, authenticated SMTP connection from the pool.
+
+    The caller must hand the connection back with ``_smtp_pool.put_nowait``.
+    If the health check or reconnect fails -- including by cancellation --
+    the slot is returned empty before re-raising, so the pool never shrinks.
+    """
+    server = await _smtp_pool.get()
+    try:
+        if server is not None and await _smtp_connection_alive(server):
+            return server
+
+        await _close_smtp_connection(server)
+        return await _open_smtp_connection()
+    except BaseException:
+        if server is not None:
+            server.close()
+        _smtp_pool.put_nowait(None)
+        raise
+
 @app.get("/health")
 async def health_check():
     """
@@ -105,6 +389,32 @@ async def health_check():
     """
     return {"status": "MVP ready"}
 
+async def extract_text_cached(content: bytes, extractor: Callable[[bytes], str]) -> str:
+    """
+    Run a document extractor in a worker thread, reusing earlier results.
+
+    The cache is content-addressed (BLAKE2b of the file bytes), so an edited
+    or renamed file never returns stale text and nothing needs invalidating.
+
+    Args:
+        content: Document bytes
+        extractor: extract_text_from_pdf or extract_text_from_docx
+
+    Returns:
+        str: Extracted text content
+    """
+    key = (hashlib.blake2b(content, digest_size=16).digest(), extractor)
+    text = _EXTRACTED_TEXT_CACHE.get(key)
+    if text is None:
+        text = await asyncio.to_thread(extractor, content)
+        _EXTRACTED_TEXT_CACHE[key] = text
+    return text
+
+def _read_file_bytes(path: str) -> bytes:
+    """Read a whole file; called through asyncio.to_thread."""
+    with open(path, 'rb') as f:
+        return f.read()
+
 @app.get("/get_file_text")
 async def get_file_text(filename: str):
     """
@@ -122,39 +432,24 @@ async def get_file_text(filename: str):
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail=f"File not found: {filename}")
 
+    if os.path.getsize(file_path) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_UPLOAD_BYTES} bytes")
+
     try:
-        # Read file content
-        with open(file_path, 'rb') as f:
-            content = f.read()
+        # Read file content without blocking the event loop
+        content = await asyncio.to_thread(_read_file_bytes, file_path)
 
-        # Determine content type based on extension
+        # Determine content type based on extension (unknown ones are read as text)
         ext = os.path.splitext(filename)[1].lower()
-        if ext == '.pdf':
-            content_type = 'application/pdf'
-        elif ext in ['.doc', '.docx']:
-            if ext == '.doc':
-                content_type = 'application/msword'
-            else:
-                content_type = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-        elif ext == '.txt':
-            content_type = 'text/plain'
-        else:
-            content_type = 'text/plain'  # Default
+        content_type = EXTENSION_CONTENT_TYPES.get(ext, 'text/plain')
 
         # Extract text
-        if content_type == 'application/pdf':
-            text = extract_text_from_pdf(content)
-        elif content_type in ['application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']:
-            text = extract_text_from_docx(content)
-        elif content_type == 'text/plain':
-            text = content.decode('utf-8')
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file format")
+        text = await extract_document_text(content, content_type)
 
         if not text.strip():
             raise HTTPException(status_code=400, detail="No text content found in the file")
 
-        print(f"✅ Extracted {len(text)} characters from {filename}")
+        logger.debug("Extracted %d characters from %s", len(text), filename)
 
         return {
             "text": text,
@@ -163,55 +458,611 @@ async def get_file_text(filename: str):
             "content_type": content_type
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ File text extraction error: {e}")
+        logger.warning("File text extraction error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to extract text from file: {str(e)}")
 
+# PDFium is not thread-safe, so PDF extraction running in worker threads is
+# serialized through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+# PDFium reports line breaks as CRLF and soft hyphens (line-break hyphens
+# in the source PDF) as U+FFFE or \x02; map them to what PyPDF2 returned
+_PDFIUM_TEXT_FIXES = str.maketrans({"\ufffe": "-", "\x02": "-"})
+
+def _pdf_page_text(page: pypdfium2.PdfPage) -> str:
+    """Text of one PDFium page (empty if it has none), closing the page afterwards."""
+    text_page = page.get_textpage()
+    try:
+        text = text_page.get_text_range() or ""
+    finally:
+        text_page.close()
+        page.close()
+    return text.replace("\r\n", "\n").translate(_PDFIUM_TEXT_FIXES)
+
 def extract_text_from_pdf(content: bytes) -> str:
     """
     Extract text from PDF file content.
 
+    Uses PDFium (via pypdfium2), which parses the document in C++ and is
+    much faster than a pure-Python parser on multi-page resumes. Safe to
+    call from worker threads (e.g. via ``asyncio.to_thread``); concurrent
+    calls take turns on _PDFIUM_LOCK.
+
     Args:
         content: PDF file bytes
 
     Returns:
         str: Extracted text content
+
+    Raises:
+        RuntimeError: If the PDF cannot be parsed
     """
     try:
-        pdf_file = io.BytesIO(content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        with _PDFIUM_LOCK:
+            pdf = pypdfium2.PdfDocument(content)
+            try:
+                text = "\n".join(_pdf_page_text(page) for page in pdf)
+            finally:
+                pdf.close()
 
         return text.strip()
     except Exception as e:
-        raise Exception(f"PDF text extraction failed: {str(e)}")
+        raise RuntimeError(f"PDF text extraction failed: {str(e)}")
+
+# WordprocessingML element tags read by extract_text_from_docx
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_PARAGRAPH = _W_NS + "p"
+_W_TEXT = _W_NS + "t"
+_W_TAB = _W_NS + "tab"
+_W_BREAKS = (_W_NS + "br", _W_NS + "cr")
+# Word stores text boxes twice (mc:Choice and a VML mc:Fallback copy)
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
 
 def extract_text_from_docx(content: bytes) -> str:
     """
     Extract text from DOCX file content.
 
+    Streams ``word/document.xml`` straight out of the DOCX zip with
+    ``iterparse`` and collects the text runs of each paragraph, instead of
+    building python-docx's full document object model. Paragraphs inside
+    text boxes get their own line after the paragraph that anchors them;
+    the duplicate ``mc:Fallback`` copy of each text box is skipped.
+
     Args:
         content: DOCX file bytes
 
+    Returns:
+        str: Extracted text content, one line per paragraph
+
+    Raises:
+        RuntimeError: If the file is not a readable DOCX document
+    """
+    try:
+        paragraphs = []
+        # (slot in paragraphs, run buffer) per open w:p; text-box paragraphs
+        # nest inside their anchor paragraph and must not flush its runs
+        open_paragraphs = []
+        fallback_depth = 0
+        with zipfile.ZipFile(io.BytesIO(content)) as docx_zip, docx_zip.open("word/document.xml") as document:
+            for event, element in ET.iterparse(document, events=("start", "end")):
+                tag = element.tag
+                if tag == _MC_FALLBACK:
+                    fallback_depth += 1 if event == "start" else -1
+                    continue
+                if fallback_depth:
+                    continue
+
+                if event == "start":
+                    if tag == _W_PARAGRAPH:
+                        # Reserve the slot now so paragraphs stay in document order
+                        open_paragraphs.append((len(paragraphs), []))
+                        paragraphs.append("")
+                    continue
+
+                if tag == _W_PARAGRAPH:
+                    slot, runs = open_paragraphs.pop()
+                    paragraphs[slot] = "".join(runs)
+                    element.clear()
+                elif not open_paragraphs:
+                    continue
+                elif tag == _W_TEXT:
+                    if element.text:
+                        open_paragraphs[-1][1].append(element.text)
+                elif tag == _W_TAB:
+                    open_paragraphs[-1][1].append("\t")
+                elif tag in _W_BREAKS:
+                    open_paragraphs[-1][1].append("\n")
+
+        return "\n".join(paragraphs).strip()
+    except Exception as e:
+        raise RuntimeError(f"DOCX text extraction failed: {str(e)}")
+
+# Document extractors by MIME type; .doc uploads go through the DOCX reader
+DOCUMENT_EXTRACTORS: Dict[str, Callable[[bytes], str]] = {
+    'application/pdf': extract_text_from_pdf,
+    'application/msword': extract_text_from_docx,
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': extract_text_from_docx,
+}
+SUPPORTED_CONTENT_TYPES = frozenset(DOCUMENT_EXTRACTORS) | {'text/plain'}
+
+# MIME type of files served by /get_file_text, by extension
+EXTENSION_CONTENT_TYPES = {
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.txt': 'text/plain',
+}
+
+async def extract_document_text(content: bytes, content_type: str) -> str:
+    """
+    Extract text from a document using the extractor for its MIME type.
+
+    Args:
+        content: Document bytes
+        content_type: MIME type, one of SUPPORTED_CONTENT_TYPES
+
     Returns:
         str: Extracted text content
+
+    Raises:
+        HTTPException: 400 if the MIME type is not supported
+    """
+    if content_type == 'text/plain':
+        return content.decode('utf-8')
+
+    extractor = DOCUMENT_EXTRACTORS.get(content_type)
+    if extractor is None:
+        raise HTTPException(status_code=400, detail="Unsupported file format")
+    # Parse off the event loop so other requests keep being served
+    return await extract_text_cached(content, extractor)
+
+async def cached_gemini_call(cache: TTLCache, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return a cached Gemini result, calling upstream at most once per key.
+
+    Concurrent misses for the same key are coalesced: the first caller starts
+    the upstream call as a task and later callers await that same task. The
+    task is shielded so a disconnecting client doesn't cancel the call for
+    everyone else. Failures and FallbackJobList results are not cached, so
+    the next request retries Gemini instead of replaying a placeholder.
+
+    Args:
+        cache: TTL cache holding completed results
+        key: Hashable cache key derived from the request payload
+        factory: Zero-argument coroutine function performing the Gemini call
+
+    Returns:
+        The cached or freshly generated result
     """
     try:
-        docx_file = io.BytesIO(content)
-        doc = Document(docx_file)
+        return cache[key]
+    except KeyError:
+        pass
 
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+    task = _inflight_gemini_calls.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight_gemini_calls[key] = task
 
-        return text.strip()
-    except Exception as e:
-        raise Exception(f"DOCX text extraction failed: {str(e)}")
+        def _store_result(done: asyncio.Task) -> None:
+            _inflight_gemini_calls.pop(key, None)
+            if done.cancelled() or done.exception() is not None:
+                return
+            result = done.result()
+            if not isinstance(result, FallbackJobList):
+                cache[key] = result
+
+        task.add_done_callback(_store_result)
+
+    return await asyncio.shield(task)
+
+class BoundedGeminiStream:
+    """
+    Streamed Gemini response that holds its concurrency slot until read.
+
+    generate_content_async(stream=True) returns once the first chunk has
+    arrived, but generation goes on while the caller iterates. The
+    semaphore slot is therefore released only when iteration ends (fully
+    read, failed or closed), or when an unread response is garbage
+    collected. Other attributes (e.g. usage_metadata) pass through.
+    """
+
+    def __init__(self, response: Any, semaphore: asyncio.Semaphore):
+        self._response = response
+        self._semaphore = semaphore
+        self._released = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._response:
+                yield chunk
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        """Give the slot back (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._semaphore.release()
+
+    def __del__(self):
+        # Covers a response that was never iterated, e.g. the client
+        # disconnected before a StreamingResponse started
+        self.release()
+
+def _log_gemini_retry(retry_state) -> None:
+    """Report a rate-limited Gemini call before tenacity backs off."""
+    logger.warning("Gemini rate limited (attempt %d), retrying in %.1fs",
+                   retry_state.attempt_number, retry_state.next_action.sleep)
+
+@retry(
+    retry=retry_if_exception_type(ResourceExhausted),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    before_sleep=_log_gemini_retry,
+    reraise=True
+)
+async def generate_gemini_content(prompt: str, stream: bool = False) -> Any:
+    """
+    Call Gemini with bounded concurrency, retrying when the quota is exhausted.
+
+    At most GEMINI_MAX_CONCURRENCY generations run at once; a streamed
+    call keeps its slot until the caller has finished iterating over the
+    returned BoundedGeminiStream. A 429 (ResourceExhausted) is retried up
+    to 5 attempts with jittered exponential backoff; the backoff sleeps
+    happen outside the semaphore so waiting calls don't hold a slot. For
+    streamed calls only the request itself is retried, not iteration over
+    the returned chunks.
+
+    Args:
+        prompt: Prompt text to send
+        stream: Request a streamed response
+
+    Returns:
+        The Gemini response, or a BoundedGeminiStream when ``stream`` is True
+
+    Raises:
+        ResourceExhausted: If the quota is still exhausted after the last attempt
+    """
+    await _gemini_semaphore.acquire()
+    try:
+        response = await GEMINI_MODEL.generate_content_async(prompt, stream=stream)
+    except BaseException:
+        _gemini_semaphore.release()
+        raise
+
+    if not stream:
+        _gemini_semaphore.release()
+        return response
+    return BoundedGeminiStream(response, _gemini_semaphore)
 
 # Gemini AI job search functionality
+# Static job-search instructions. Gemini 2.5 implicitly caches repeated
+# prompt prefixes longer than ~1024 tokens, so everything that does not
+# depend on the user's query lives in this preamble and the query itself is
+# appended at the very end of the prompt. Keep the preamble byte-for-byte
+# stable across requests (no interpolation) or the cache will miss.
+JOB_SEARCH_PREAMBLE = """You are a job-market data generator for an Indian job application tool.
+Your task is to produce realistic, plausible job postings for the search
+described in the user query at the end of this prompt. The postings are
+shown to job seekers as sample listings, so they must read like genuine
+openings published by real employers on Indian job boards.
+
+Each job posting must include:
+- Company name (realistic tech/IT company)
+- Exact job title
+- Brief description snippet (2-3 sentences)
+- HR contact email (if none exists, suggest hr@company.com format)
+- Phone number in the Indian landline format for the job's city
+
+Guidelines for realistic postings in the Indian market:
+
+Company names
+- Use names that sound like established Indian IT services firms, product
+  companies, funded startups, global capability centres (GCCs) of
+  multinational corporations, or fintech/edtech/healthtech scale-ups.
+- Mix company types within one answer: for example one large services or
+  GCC employer, one growth-stage product company and one smaller startup.
+- Do not reuse the same company twice in one answer and do not use the
+  names of real, well-known companies verbatim.
+- Prefer names with a plausible legal suffix where natural, such as
+  "Technologies", "Solutions", "Labs", "Systems", "Pvt Ltd" or "India".
+
+Job titles
+- Stay faithful to the requested role. Use the exact title or a common
+  seniority variant of it (e.g. Associate, Senior, Lead, Principal, Head).
+- Align seniority with the salary range when one is given: roughly
+  3-8 LPA for entry level, 8-15 LPA for mid level, 15-30 LPA for senior,
+  30-50 LPA for lead or principal roles and 50 LPA and above for
+  director-level positions.
+- Avoid inflated or joke titles ("Ninja", "Rockstar", "Guru").
+
+Descriptions
+- Write 2-3 complete sentences, roughly 35-60 words in total.
+- Sentence one describes the team, product or business domain.
+- Sentence two lists the core responsibilities using concrete verbs
+  (own, build, ship, analyse, drive, mentor, design, partner with).
+- An optional third sentence names 2-4 must-have skills or tools and the
+  expected years of experience.
+- Mention the work mode when it is natural: on-site, hybrid or remote.
+- When a salary range is given, you may reference it once in the
+  description using the LPA convention (e.g. "CTC 15-20 LPA").
+- Use Indian English spelling (e.g. "organisation", "analyse") and
+  Indian business conventions such as CTC, LPA, notice period and
+  immediate joiners.
+- Do not invent benefits that sound implausible for the company type.
+
+Contact email
+- Use a recruiting mailbox on the company's own domain, for example
+  careers@, talent@, recruitment@ or hr@ followed by a domain derived
+  from the company name (lowercase, no spaces, ending in .com, .in or
+  .co.in).
+- If no better option exists, use the hr@company.com format.
+- Never use personal webmail domains such as gmail.com or yahoo.com.
+
+Phone number
+- Use the landline STD code of the job's city with the format
+  +91-<STD code>-XXXX-XXXX, for example Bangalore +91-80-XXXX-XXXX,
+  Mumbai +91-22-XXXX-XXXX, Delhi/NCR +91-11-XXXX-XXXX, Chennai
+  +91-44-XXXX-XXXX, Hyderabad +91-40-XXXX-XXXX, Pune +91-20-XXXX-XXXX,
+  Kolkata +91-33-XXXX-XXXX and Ahmedabad +91-79-XXXX-XXXX.
+- For Gurugram use +91-124-XXX-XXXX and for Noida use +91-120-XXX-XXXX.
+- For remote roles or cities not listed above, use the STD code of the
+  nearest major metro.
+- Replace every X with a digit; do not reuse the same number twice.
+
+Location realism
+- Reflect the character of the city's tech ecosystem: for example
+  Bangalore for SaaS, product and deep-tech companies, Hyderabad and Pune
+  for GCCs and enterprise software, Mumbai for fintech, BFSI and media,
+  Delhi/NCR for consumer internet and e-commerce, Chennai for SaaS and
+  automotive technology.
+- Refer to real neighbourhoods or tech parks only in general terms
+  (e.g. "Outer Ring Road", "HITEC City", "Hinjewadi") and only when it
+  reads naturally.
+
+Variety and quality checks
+- The postings in one answer should differ in company size, industry
+  domain, seniority band and work mode so the job seeker sees a range of
+  realistic options rather than three copies of the same listing.
+- Keep every posting internally consistent: the title, seniority,
+  salary, required experience and responsibilities must match each other.
+- Keep the tone professional and factual; avoid marketing superlatives,
+  emojis, exclamation marks and all-caps words.
+- Do not include discriminatory requirements (age, gender, religion,
+  marital status) or requests for payment from candidates.
+- Before answering, re-read each posting and fix anything that would look
+  out of place on a reputable Indian job board.
+
+Output rules
+- Respond with JSON only, exactly in the structure requested below.
+- Every value must be a plain JSON string; do not use null, nested
+  objects or additional keys inside a job posting.
+- Do not add commentary before or after the JSON.
+"""
+
+# Output format for a single search, appended to the preamble once at import
+JOB_SEARCH_PROMPT_PREFIX = JOB_SEARCH_PREAMBLE + """
+Output as a JSON array of objects with this exact structure:
+[
+    {
+        "company": "Company Name",
+        "title": "Job Title",
+        "description": "Brief description snippet",
+        "emails": "hr@company.com",
+        "phone": "+91-80-1234-5678"
+    }
+]
+"""
+
+# The only per-request part of a single-search prompt
+JOB_SEARCH_QUERY_TEMPLATE = """
+User query: Generate 3 realistic job postings for {title} position in {location}{ctc_text}.
+Make the jobs realistic for the Indian market and {location} specifically.
+"""
+
+def build_job_search_prompt(title: str, location: str, ctc: Optional[str] = None) -> str:
+    """
+    Build the Gemini prompt that asks for realistic job postings.
+
+    The static JOB_SEARCH_PROMPT_PREFIX comes first so Gemini can serve it
+    from its implicit prompt cache; only the short user query varies and
+    is the only part formatted per request.
+
+    Args:
+        title: Job title (e.g., "Product Manager")
+        location: Job location (e.g., "Bangalore")
+        ctc: Salary range (e.g., "10-15 LPA")
+
+    Returns:
+        str: Prompt requesting a JSON array of job postings
+    """
+    ctc_text = f" at {ctc} salary range" if ctc else ""
+    return JOB_SEARCH_PROMPT_PREFIX + JOB_SEARCH_QUERY_TEMPLATE.format_map(
+        {"title": title, "location": location, "ctc_text": ctc_text}
+    )
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Start of a JSON array of objects (or an empty array). Matching "[{" rather
+# than any "[" skips bracketed prose such as "[Note]" without a failed decode.
+_JSON_ARRAY_START_RE = re.compile(r"\[\s*[{\]]")
+
+def extract_json_array(response_text: str) -> list:
+    """
+    Extract the JSON array from a Gemini response.
+
+    A precompiled pattern finds the first ``[`` that opens an array of
+    objects, and a single ``raw_decode`` pass from there reads exactly one
+    JSON value, ignoring any prose or code fence that follows it. If that
+    candidate still fails to decode, the next one is tried.
+
+    Args:
+        response_text: Raw model output, possibly wrapped in prose or code fences
+
+    Returns:
+        list: The decoded JSON array
+
+    Raises:
+        ValueError: If no JSON array is present (json.JSONDecodeError is a subclass)
+    """
+    match = _JSON_ARRAY_START_RE.search(response_text)
+    while match is not None:
+        try:
+            data, _ = _JSON_DECODER.raw_decode(response_text, match.start())
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, list):
+            return data
+        match = _JSON_ARRAY_START_RE.search(response_text, match.start() + 1)
+
+    raise ValueError("No JSON array found in response")
+
+# Output format for batched searches; shares the preamble's cache prefix
+JOB_SEARCH_BATCH_PROMPT_PREFIX = JOB_SEARCH_PREAMBLE + """
+The user query contains several numbered job searches. Generate 3
+realistic job postings for each search and output a JSON array with one
+object per search, using the search number as "index", with this exact
+structure:
+[
+    {
+        "index": 0,
+        "jobs": [
+            {
+                "company": "Company Name",
+                "title": "Job Title",
+                "description": "Brief description snippet",
+                "emails": "hr@company.com",
+                "phone": "+91-80-1234-5678"
+            }
+        ]
+    }
+]
+"""
+
+JOB_SEARCH_BATCH_QUERY_TEMPLATE = """
+User query:
+{searches}
+Make the jobs realistic for the Indian market and each search's location specifically.
+"""
+
+def build_job_search_batch_prompt(queries: List[JobSearchRequest]) -> str:
+    """
+    Build one Gemini prompt that answers several job searches at once.
+
+    Shares JOB_SEARCH_PREAMBLE with the single-search prompt so both hit the
+    same implicit prompt-cache prefix.
+
+    Args:
+        queries: Job searches to answer, identified by their list index
+
+    Returns:
+        str: Prompt requesting a JSON array of {"index", "jobs"} objects
+    """
+    searches = "\n".join(
+        f"{i}. {q.title} position in {q.location}" + (f" at {q.ctc} salary range" if q.ctc else "")
+        for i, q in enumerate(queries)
+    )
+    return JOB_SEARCH_BATCH_PROMPT_PREFIX + JOB_SEARCH_BATCH_QUERY_TEMPLATE.format_map({"searches": searches})
+
+def log_prompt_cache_usage(response: Any) -> None:
+    """
+    Report how much of a prompt Gemini served from its implicit cache.
+
+    Args:
+        response: Gemini response (for streamed responses, after iteration)
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    cached = getattr(usage, "cached_content_token_count", 0) or 0
+    logger.debug("Gemini prompt tokens: %s, served from cache: %s", usage.prompt_token_count, cached)
+
+class FallbackJobList(list):
+    """Job list containing the template posting; served but never cached."""
+
+def fallback_job_posting(title: str, location: str) -> JobPosting:
+    """Template job posting used when Gemini output cannot be parsed."""
+    return JobPosting(
+        company="Tech Solutions Ltd",
+        title=f"{title}",
+        description=f"We are looking for a skilled {title} to join our team in {location}. Competitive salary package offered.",
+        emails="hr@techsolutions.com",
+        phone="+91-80-1234-5678"
+    )
+
+class JsonArrayScanner:
+    """
+    Incrementally split a streamed JSON array into its object elements.
+
+    Gemini streams the job array in arbitrary text chunks. The scanner tracks
+    bracket depth and string/escape state so that every time an element
+    object closes, its complete JSON text is handed back for parsing -- long
+    before the closing ``]`` of the whole array arrives. Any prose before
+    the opening ``[`` (e.g. a Markdown code fence) is ignored.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = None
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            text: Newly received chunk of the model response
+
+        Returns:
+            List of JSON object strings completed by this chunk
+        """
+        self._buf += text
+        buf = self._buf
+        objects = []
+
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if self._depth == 0:
+                if ch == '[':
+                    self._depth = 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '[{':
+                self._depth += 1
+                if self._depth == 2 and ch == '{':
+                    self._start = i
+            elif ch in ']}':
+                self._depth -= 1
+                if self._depth == 1 and self._start is not None:
+                    objects.append(buf[self._start:i + 1])
+                    self._start = None
+
+        # Only the unfinished element (if any) needs to stay buffered
+        keep_from = self._start if self._start is not None else len(buf)
+        self._buf = buf[keep_from:]
+        self._pos = len(self._buf)
+        if self._start is not None:
+            self._start = 0
+
+        return objects
+
 async def generate_jobs_with_gemini(title: str, location: str, ctc: Optional[str] = None) -> List[JobPosting]:
     """
     Generate realistic job postings using Gemini AI.
@@ -234,77 +1085,244 @@ async def generate_jobs_with_gemini(title: str, location: str, ctc: Optional[str
         )
 
     try:
-        # Initialize Gemini model (using gemini-2.5-flash as requested)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-
         # Create detailed prompt for realistic job generation
-        ctc_text = f" at {ctc} salary range" if ctc else ""
-        prompt = f"""
-        Generate 3 realistic job postings for {title} position in {location}{ctc_text}.
-        Each job should include:
-        - Company name (realistic tech/IT company)
-        - Exact job title
-        - Brief description snippet (2-3 sentences)
-        - HR contact email (if none exists, suggest hr@company.com format)
-        - Phone number (Bangalore format: +91-80-XXXX-XXXX)
-
-        Output as a JSON array of objects with this exact structure:
-        [
-            {{
-                "company": "Company Name",
-                "title": "Job Title",
-                "description": "Brief description snippet",
-                "emails": "hr@company.com",
-                "phone": "+91-80-1234-5678"
-            }}
-        ]
-
-        Make the jobs realistic for the Indian market and {location} specifically.
-        """
+        prompt = build_job_search_prompt(title, location, ctc)
 
         # Generate response from Gemini
-        response = model.generate_content(prompt)
+        response = await generate_gemini_content(prompt)
+        log_prompt_cache_usage(response)
 
         # Parse JSON response
         try:
-            # Extract JSON from response text
-            response_text = response.text.strip()
-            # Find JSON array in response (in case of extra text)
-            start_idx = response_text.find('[')
-            end_idx = response_text.rfind(']') + 1
-            if start_idx == -1 or end_idx == 0:
-                raise ValueError("No JSON array found in response")
-
-            json_str = response_text[start_idx:end_idx]
-            jobs_data = json.loads(json_str)
-
-            # Convert to JobPosting objects
-            jobs = []
-            for job_data in jobs_data:
-                jobs.append(JobPosting(**job_data))
-
-            return jobs
+            # Extract JSON from response text and validate every posting at once
+            return _JOB_LIST_ADAPTER.validate_python(extract_json_array(response.text))
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             # If JSON parsing fails, create a fallback response
-            print(f"Failed to parse Gemini response: {e}")
-            return [
-                JobPosting(
-                    company="Tech Solutions Ltd",
-                    title=f"{title}",
-                    description=f"We are looking for a skilled {title} to join our team in {location}. Competitive salary package offered.",
-                    emails="hr@techsolutions.com",
-                    phone="+91-80-1234-5678"
-                )
-            ]
+            logger.warning("Failed to parse Gemini response: %s", e)
+            return FallbackJobList([fallback_job_posting(title, location)])
 
     except Exception as e:
-        print(f"Gemini API error: {e}")
+        logger.warning("Gemini API error: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Failed to generate job listings. Please check your API quota and try again."
         )
 
+async def stream_job_batches_with_gemini(queries: List[JobSearchRequest]) -> AsyncIterator[Tuple[int, List[JobPosting]]]:
+    """
+    Stream the answers to a batched job-search prompt as they complete.
+
+    The batched response is fed through a JsonArrayScanner, so each query's
+    {"index", "jobs"} entry is parsed and yielded as soon as it closes.
+
+    Args:
+        queries: Job searches to answer
+
+    Yields:
+        tuple: (query index, job postings) for every parseable entry
+    """
+    response = await generate_gemini_content(build_job_search_batch_prompt(queries), stream=True)
+
+    scanner = JsonArrayScanner()
+    answered = set()
+    async for chunk in response:
+        for obj in scanner.feed(chunk.text):
+            try:
+                item = orjson.loads(obj)
+                index = int(item["index"])
+                if not 0 <= index < len(queries) or index in answered:
+                    continue
+                jobs = [JobPosting(**job_data) for job_data in item["jobs"]]
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug("Skipping unparseable batch entry: %s", e)
+                continue
+            answered.add(index)
+            yield index, jobs
+
+    log_prompt_cache_usage(response)
+
+async def generate_job_batches_with_gemini(queries: List[JobSearchRequest]) -> List[List[JobPosting]]:
+    """
+    Answer several job searches with a single Gemini call.
+
+    Args:
+        queries: Job searches to answer
+
+    Returns:
+        One list of job postings per query, in request order. Queries missing
+        from (or unparseable in) the model output get the fallback posting.
+
+    Raises:
+        HTTPException: If Gemini API key is not configured or API call fails
+    """
+    if not GEMINI_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="Gemini API key not configured. Please add GEMINI_API_KEY to .env file."
+        )
+
+    results: List[Optional[List[JobPosting]]] = [None] * len(queries)
+    try:
+        async for index, jobs in stream_job_batches_with_gemini(queries):
+            results[index] = jobs
+    except Exception as e:
+        logger.warning("Gemini API error: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to generate job listings. Please check your API quota and try again."
+        )
+
+    return [
+        jobs if jobs is not None else FallbackJobList([fallback_job_posting(query.title, query.location)])
+        for query, jobs in zip(queries, results)
+    ]
+
+async def enqueue_job_search(request: JobSearchRequest) -> List[JobPosting]:
+    """
+    Submit a job search to the micro-batcher and wait for its result.
+
+    Args:
+        request: Job search to answer
+
+    Returns:
+        List of job postings for this search
+    """
+    future = asyncio.get_running_loop().create_future()
+    await _job_search_queue.put((request, future))
+    return await future
+
+def _settle(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Resolve a waiting request's future unless its caller already went away."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+async def dispatch_job_search_batch(batch: List[Tuple[JobSearchRequest, asyncio.Future]]) -> None:
+    """
+    Answer one micro-batch of queued job searches.
+
+    A batch of one uses the regular single-search prompt. Larger batches
+    share one streamed Gemini call, and each waiting request is resolved
+    as soon as its own entry has been parsed.
+
+    Args:
+        batch: (request, future) pairs collected by the batcher
+    """
+    if len(batch) == 1:
+        request, future = batch[0]
+        try:
+            _settle(future, await generate_jobs_with_gemini(request.title, request.location, request.ctc))
+        except Exception as e:
+            _settle(future, error=e)
+        return
+
+    queries = [request for request, _ in batch]
+    futures = [future for _, future in batch]
+    try:
+        if not GEMINI_API_KEY:
+            raise HTTPException(
+                status_code=500,
+                detail="Gemini API key not configured. Please add GEMINI_API_KEY to .env file."
+            )
+        async for index, jobs in stream_job_batches_with_gemini(queries):
+            _settle(futures[index], jobs)
+    except Exception as e:
+        logger.warning("Gemini API error: %s", e)
+        if not isinstance(e, HTTPException):
+            e = HTTPException(
+                status_code=500,
+                detail="Failed to generate job listings. Please check your API quota and try again."
+            )
+        for future in futures:
+            _settle(future, error=e)
+        return
+
+    for query, future in zip(queries, futures):
+        _settle(future, FallbackJobList([fallback_job_posting(query.title, query.location)]))
+
+async def run_job_search_batcher() -> None:
+    """
+    Group concurrent /search_jobs requests into batched Gemini calls.
+
+    After the first request arrives, keep collecting for up to
+    SEARCH_BATCH_WINDOW seconds or until SEARCH_BATCH_MAX_SIZE requests are
+    waiting, then dispatch the batch in its own task and start collecting
+    the next one.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _job_search_queue.get()]
+        deadline = loop.time() + SEARCH_BATCH_WINDOW
+        while len(batch) < SEARCH_BATCH_MAX_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_job_search_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        task = asyncio.create_task(dispatch_job_search_batch(batch))
+        _job_search_dispatches.add(task)
+        task.add_done_callback(_job_search_dispatches.discard)
+
+@app.on_event("startup")
+async def start_job_search_batcher():
+    """Start the background task that micro-batches /search_jobs requests."""
+    global _job_search_queue, _job_search_batcher
+    _job_search_queue = asyncio.Queue()
+    _job_search_batcher = asyncio.create_task(run_job_search_batcher())
+
+@app.on_event("shutdown")
+async def stop_job_search_batcher():
+    """Stop collecting new job-search batches."""
+    if _job_search_batcher is not None:
+        _job_search_batcher.cancel()
+
+async def stream_jobs_with_gemini(title: str, location: str, ctc: Optional[str] = None) -> AsyncIterator[JobPosting]:
+    """
+    Stream job postings from Gemini as soon as each one is complete.
+
+    The response is requested with ``stream=True`` and fed through a
+    JsonArrayScanner, so the first job is yielded when its object closes
+    rather than after the whole array has been generated.
+
+    Args:
+        title: Job title (e.g., "Product Manager")
+        location: Job location (e.g., "Bangalore")
+        ctc: Salary range (e.g., "10-15 LPA")
+
+    Yields:
+        JobPosting: Each parsed job posting; nothing if no element of the
+        response could be parsed (the caller decides on a fallback)
+    """
+    response = await generate_gemini_content(build_job_search_prompt(title, location, ctc), stream=True)
+
+    scanner = JsonArrayScanner()
+    async for chunk in response:
+        for obj in scanner.feed(chunk.text):
+            try:
+                job = JobPosting.model_validate_json(obj)
+            except (json.JSONDecodeError, ValueError, TypeError) as e:
+                logger.debug("Skipping unparseable streamed job: %s", e)
+                continue
+            yield job
+
+    log_prompt_cache_usage(response)
+
+# NDJSON line reporting a mid-stream failure, serialized once
+_STREAM_ERROR_LINE = orjson.dumps(
+    {"error": "Failed to generate job listings. Please check your API quota and try again."}
+) + b"\n"
+
+def job_search_cache_key(request: JobSearchRequest) -> Tuple[str, str, str, Optional[str]]:
+    """Cache key shared by /search_jobs and /search_jobs/stream."""
+    return ("search_jobs", request.title.strip().lower(), request.location.strip().lower(), request.ctc)
+
 @app.post("/search_jobs", response_model=List[JobPosting])
 async def search_jobs(request: JobSearchRequest):
     """
@@ -312,6 +1330,8 @@ async def search_jobs(request: JobSearchRequest):
 
     This endpoint uses Gemini AI to generate realistic job postings
     based on the provided title, location, and CTC (Cost to Company).
+    Repeated searches are served from an in-process cache, and concurrent
+    searches are micro-batched into shared Gemini calls.
 
     Request Body:
         - title: Job title (e.g., "Product Manager")
@@ -321,16 +1341,183 @@ async def search_jobs(request: JobSearchRequest):
     Returns:
         List of job postings with company, title, description, emails, and phone
     """
-    jobs = await generate_jobs_with_gemini(request.title, request.location, request.ctc)
+    key = job_search_cache_key(request)
+    jobs = await cached_gemini_call(
+        _job_search_cache,
+        key,
+        lambda: enqueue_job_search(request)
+    )
     return jobs
 
+@app.post("/search_jobs_batch", response_model=List[List[JobPosting]])
+async def search_jobs_batch(request: JobSearchBatchRequest):
+    """
+    Run several job searches with one Gemini call.
+
+    Batching amortizes the per-call overhead of Gemini across queries; the
+    model is prompted once for every (title, location, ctc) and the answer
+    is split back into one result list per query.
+
+    Request Body:
+        - queries: List of job searches, each with title, location and optional ctc
+
+    Returns:
+        List of job posting lists, in the same order as the queries
+    """
+    if not request.queries:
+        raise HTTPException(status_code=400, detail="At least one query is required")
+    if len(request.queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many queries: {len(request.queries)}. Maximum per batch is {MAX_BATCH_QUERIES}"
+        )
+
+    return await generate_job_batches_with_gemini(request.queries)
+
+@app.post("/search_jobs/stream")
+async def search_jobs_stream(request: JobSearchRequest):
+    """
+    Stream AI-generated job postings as newline-delimited JSON.
+
+    Same input as /search_jobs, but each job is written as one JSON line the
+    moment Gemini finishes generating it, so clients can render the first
+    result without waiting for the complete list.
+
+    Shares the /search_jobs cache: a cached result (or one already being
+    generated by /search_jobs) is written out immediately, and a completed
+    stream is stored for later requests. On a miss the search gets its own
+    streamed Gemini call and does not go through the micro-batcher --
+    joining a batch would delay the first line until the whole batch
+    entry had been generated, which defeats streaming.
+
+    Request Body:
+        - title: Job title (e.g., "Product Manager")
+        - location: Job location (e.g., "Bangalore")
+        - ctc: Salary range (e.g., "10-15 LPA")
+
+    Returns:
+        StreamingResponse: application/x-ndjson, one job posting per line.
+        A line of the form {"error": "..."} reports a mid-stream failure.
+    """
+    if not GEMINI_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="Gemini API key not configured. Please add GEMINI_API_KEY to .env file."
+        )
+
+    key = job_search_cache_key(request)
+
+    async def ndjson_lines():
+        try:
+            jobs = _job_search_cache.get(key)
+            if jobs is None and key in _inflight_gemini_calls:
+                jobs = await asyncio.shield(_inflight_gemini_calls[key])
+            if jobs is not None:
+                for job in jobs:
+                    yield job.model_dump_json() + "\n"
+                return
+
+            jobs = []
+            async for job in stream_jobs_with_gemini(request.title, request.location, request.ctc):
+                jobs.append(job)
+                yield job.model_dump_json() + "\n"
+
+            if jobs:
+                _job_search_cache[key] = jobs
+            else:
+                logger.warning("Failed to parse any job from streamed Gemini response")
+                yield fallback_job_posting(request.title, request.location).model_dump_json() + "\n"
+        except Exception as e:
+            logger.warning("Gemini streaming error: %s", e)
+            yield _STREAM_ERROR_LINE
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+COVER_LETTER_PROMPT_TEMPLATE = """
+Write a 150-word professional cover letter for {job_title} position at {company}.
+Highlight relevant skills and experiences from this resume: {resume_text}.
+
+The cover letter should:
+- Be professional and concise (around 150 words)
+- Show enthusiasm for the role and company
+- Connect resume skills to job requirements
+- Include a strong opening and closing
+- Be ready to copy-paste into an email
+
+Format it as a proper business letter with:
+- Greeting (Dear Hiring Manager,)
+- 3-4 paragraphs
+- Professional closing (Best regards, [Name])
+"""
+
+def build_cover_letter_prompt(job_title: str, company: str, resume_text: str) -> str:
+    """
+    Build the Gemini prompt for a cover letter.
+
+    Args:
+        job_title: Target job title (e.g., "Product Manager")
+        company: Target company name (e.g., "TechCorp Solutions")
+        resume_text: Resume content/skills to highlight
+
+    Returns:
+        str: Prompt requesting a ~150-word business letter
+    """
+    return COVER_LETTER_PROMPT_TEMPLATE.format_map(
+        {"job_title": job_title, "company": company, "resume_text": resume_text}
+    )
+
+async def generate_cover_with_gemini(job_title: str, company: str, resume_text: str) -> str:
+    """
+    Generate a professional cover letter using Gemini AI.
+
+    Args:
+        job_title: Target job title (e.g., "Product Manager")
+        company: Target company name (e.g., "TechCorp Solutions")
+        resume_text: Resume content/skills to highlight
+
+    Returns:
+        str: The generated cover letter text
+
+    Raises:
+        HTTPException: If Gemini API key is not configured or API call fails
+    """
+    if not GEMINI_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="Gemini API key not configured. Please add GEMINI_API_KEY to .env file."
+        )
+
+    try:
+        # Generate cover letter
+        response = await generate_gemini_content(build_cover_letter_prompt(job_title, company, resume_text))
+        return response.text.strip()
+
+    except Exception as e:
+        logger.warning("Cover letter generation error: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to generate cover letter. Please try again."
+        )
+
+def cover_letter_cache_key(request: CoverLetterRequest) -> Tuple[str, str, str, str]:
+    """
+    Cache key for a cover letter request.
+
+    The resume is keyed by its SHA-256 digest rather than ``hash()``: the
+    key stays small, and two different resumes can't collide on a 64-bit
+    hash and receive each other's letter.
+    """
+    digest = hashlib.sha256(request.resume_text.encode("utf-8")).hexdigest()
+    return ("generate_cover", request.job_title, request.company, digest)
+
 @app.post("/generate_cover")
 async def generate_cover_letter(request: CoverLetterRequest):
     """
     Generate a professional cover letter using Gemini AI.
 
     This endpoint creates a personalized cover letter based on the job title,
-    company, and resume text provided.
+    company, and resume text provided. Identical requests are served from
+    an in-process cache.
 
     Request Body:
         - job_title: Target job title (e.g., "Product Manager")
@@ -340,6 +1527,79 @@ async def generate_cover_letter(request: CoverLetterRequest):
     Returns:
         dict: Contains the generated cover letter text
     """
+    key = cover_letter_cache_key(request)
+    cover_letter = await cached_gemini_call(
+        _cover_letter_cache,
+        key,
+        lambda: generate_cover_with_gemini(request.job_title, request.company, request.resume_text)
+    )
+
+    return {"cover_letter": cover_letter}
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> bytes:
+    """Encode one Server-Sent Event with a JSON data payload."""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+async def format_cover_letter_stream(chunks: AsyncIterator[str], sse: bool) -> AsyncIterator[Any]:
+    """
+    Frame streamed cover-letter text as plain text or Server-Sent Events.
+
+    Plain text can't signal a failure once the 200 status is sent, so the
+    letter just ends early. SSE sends ``data: {"token": ...}`` per chunk,
+    then ``event: done`` -- or ``event: error`` if generation fails midway.
+
+    Args:
+        chunks: Letter text as it is generated
+        sse: Emit text/event-stream framing instead of raw text
+    """
+    try:
+        async for text in chunks:
+            yield _sse_event({"token": text}) if sse else text
+    except Exception as e:
+        logger.warning("Cover letter streaming error: %s", e)
+        if sse:
+            yield _sse_event({"error": "Failed to generate cover letter. Please try again."}, "error")
+        return
+
+    if sse:
+        yield _sse_event({}, "done")
+
+@app.post("/generate_cover/stream")
+async def generate_cover_letter_stream(request: CoverLetterRequest, http_request: Request):
+    """
+    Stream a cover letter while Gemini generates it.
+
+    Same input as /generate_cover, but the letter is written to the client
+    chunk by chunk, so the first words appear after roughly one round-trip
+    instead of after the whole letter. Shares the /generate_cover cache: a
+    cached letter is sent at once, and a completely streamed letter is
+    cached for later requests. Clients that send
+    ``Accept: text/event-stream`` get JSON-framed Server-Sent Events.
+
+    Request Body:
+        - job_title: Target job title (e.g., "Product Manager")
+        - company: Target company name (e.g., "TechCorp Solutions")
+        - resume_text: Resume content/skills to highlight
+
+    Returns:
+        StreamingResponse: text/plain cover letter, or text/event-stream
+        with {"token": ...} events. Errors before the first chunk return
+        HTTP 500.
+    """
+    sse = "text/event-stream" in http_request.headers.get("accept", "")
+    media_type = "text/event-stream" if sse else "text/plain"
+
+    key = cover_letter_cache_key(request)
+    cover_letter = _cover_letter_cache.get(key)
+    if cover_letter is None and key in _inflight_gemini_calls:
+        cover_letter = await asyncio.shield(_inflight_gemini_calls[key])
+    if cover_letter is not None:
+        async def cached_chunks():
+            yield cover_letter
+
+        return StreamingResponse(format_cover_letter_stream(cached_chunks(), sse), media_type=media_type)
+
     if not GEMINI_API_KEY:
         raise HTTPException(
             status_code=500,
@@ -347,40 +1607,59 @@ async def generate_cover_letter(request: CoverLetterRequest):
         )
 
     try:
-        # Initialize Gemini model
-        model = genai.GenerativeModel('gemini-2.5-flash')
-
-        # Create cover letter prompt
-        prompt = f"""
-        Write a 150-word professional cover letter for {request.job_title} position at {request.company}.
-        Highlight relevant skills and experiences from this resume: {request.resume_text}.
-
-        The cover letter should:
-        - Be professional and concise (around 150 words)
-        - Show enthusiasm for the role and company
-        - Connect resume skills to job requirements
-        - Include a strong opening and closing
-        - Be ready to copy-paste into an email
-
-        Format it as a proper business letter with:
-        - Greeting (Dear Hiring Manager,)
-        - 3-4 paragraphs
-        - Professional closing (Best regards, [Name])
-        """
-
-        # Generate cover letter
-        response = model.generate_content(prompt)
-        cover_letter = response.text.strip()
-
-        return {"cover_letter": cover_letter}
-
+        response = await generate_gemini_content(
+            build_cover_letter_prompt(request.job_title, request.company, request.resume_text),
+            stream=True
+        )
     except Exception as e:
-        print(f"Cover letter generation error: {e}")
+        logger.warning("Cover letter generation error: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Failed to generate cover letter. Please try again."
         )
 
+    async def letter_chunks():
+        parts = []
+        async for chunk in response:
+            # Drop leading whitespace so the stream matches /generate_cover's strip()
+            text = chunk.text if parts else chunk.text.lstrip()
+            if text:
+                parts.append(text)
+                yield text
+
+        cover_letter = "".join(parts).strip()
+        if cover_letter:
+            _cover_letter_cache[key] = cover_letter
+
+    return StreamingResponse(format_cover_letter_stream(letter_chunks(), sse), media_type=media_type)
+
+@app.post("/apply_prep")
+async def apply_prep(request: ApplyPrepRequest):
+    """
+    Search for jobs and generate a cover letter in one round-trip.
+
+    The two Gemini calls are independent, so they run concurrently and the
+    response arrives after the slower of the two rather than their sum.
+    Both go through the same caching (and job-search batching) as the
+    individual endpoints.
+
+    Request Body:
+        - search: Job search criteria (title, location, optional ctc)
+        - cover: Cover letter inputs (job_title, company, resume_text)
+
+    Returns:
+        dict: Contains the job postings and the generated cover letter
+    """
+    jobs, cover = await asyncio.gather(
+        search_jobs(request.search),
+        generate_cover_letter(request.cover)
+    )
+
+    return {
+        "jobs": jobs,
+        "cover_letter": cover["cover_letter"]
+    }
+
 @app.post("/extract_text")
 async def extract_text_from_file(file: UploadFile = File(...)):
     """
@@ -396,33 +1675,31 @@ async def extract_text_from_file(file: UploadFile = File(...)):
         dict: Contains the extracted text content
     """
     # Validate file type
-    allowed_types = ['application/pdf', 'application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'text/plain']
-    if file.content_type not in allowed_types:
+    if file.content_type not in SUPPORTED_CONTENT_TYPES:
         raise HTTPException(
             status_code=400,
             detail=f"Unsupported file type: {file.content_type}. Allowed types: PDF, DOC, DOCX, TXT"
         )
 
+    # Reject oversized uploads before copying them into memory
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_UPLOAD_BYTES} bytes")
+
     try:
-        # Read file content
-        content = await file.read()
-
-        if file.content_type == 'application/pdf':
-            # Extract text from PDF
-            text = extract_text_from_pdf(content)
-        elif file.content_type in ['application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']:
-            # Extract text from DOC/DOCX
-            text = extract_text_from_docx(content)
-        elif file.content_type == 'text/plain':
-            # Extract text from plain text file
-            text = content.decode('utf-8')
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file format")
+        # Read file content in bounded chunks; size may be unknown up front
+        buf = bytearray()
+        while chunk := await file.read(UPLOAD_READ_CHUNK):
+            buf.extend(chunk)
+            if len(buf) > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail=f"File too large. Maximum size is {MAX_UPLOAD_BYTES} bytes")
+        content = bytes(buf)
+
+        text = await extract_document_text(content, file.content_type)
 
         if not text.strip():
             raise HTTPException(status_code=400, detail="No text content found in the uploaded file")
 
-        print(f"✅ Extracted {len(text)} characters from {file.filename}")
+        logger.debug("Extracted %d characters from %s", len(text), file.filename)
 
         return {
             "text": text,
@@ -431,20 +1708,94 @@ async def extract_text_from_file(file: UploadFile = File(...)):
             "content_type": file.content_type
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Text extraction error: {e}")
+        logger.warning("Text extraction error: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to extract text from file: {str(e)}"
         )
 
+SUBJECT_PROMPT_TEMPLATE = """
+    Generate a professional and compelling email subject line for a job application.
+
+    Job Title: {job_title}
+    Company: {company}
+    Job Description: {job_description}
+    Cover Letter Preview: {cover_letter_preview}...
+
+    The subject line should:
+    - Be professional and concise (under 80 characters if possible)
+    - Include the job title and company name
+    - Be compelling and encourage the recruiter to open the email
+    - Sound natural and not spammy
+    - Focus on the candidate's interest and qualifications
+
+    Examples of good subject lines:
+    - "Product Manager Application - Accelify Solutions"
+    - "Experienced PM Interested in [Company] Opportunity"
+    - "Application for [Job Title] Position at [Company]"
+
+    Generate one strong subject line:
+    """
+
+def build_subject_prompt(request: SubjectGenerationRequest) -> str:
+    """
+    Build the Gemini prompt for an email subject line.
+
+    Args:
+        request: Job title, company, job description and cover letter
+
+    Returns:
+        str: Prompt asking for a single subject line
+    """
+    return SUBJECT_PROMPT_TEMPLATE.format_map({
+        "job_title": request.job_title,
+        "company": request.company,
+        "job_description": request.job_description,
+        "cover_letter_preview": request.cover_letter_content[:200],
+    })
+
+async def generate_subject_with_gemini(request: SubjectGenerationRequest) -> str:
+    """
+    Generate an email subject line for a job application using Gemini AI.
+
+    Args:
+        request: Job title, company, job description and cover letter
+
+    Returns:
+        str: Cleaned-up subject line of at most 100 characters
+
+    Raises:
+        Exception: Any Gemini error, so the caller can fall back (uncached)
+    """
+    response = await generate_gemini_content(build_subject_prompt(request))
+    subject = response.text.strip()
+
+    # Clean up the subject (remove quotes if present)
+    subject = subject.strip('"').strip("'").strip()
+
+    # Ensure it's not too long
+    if len(subject) > 100:
+        subject = subject[:97] + "..."
+
+    return subject
+
+def subject_cache_key(request: SubjectGenerationRequest) -> Tuple[str, str]:
+    """Content-addressed cache key: SHA-256 of the request payload with sorted keys."""
+    payload = orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return ("generate_subject", hashlib.sha256(payload).hexdigest())
+
 @app.post("/generate_subject")
 async def generate_email_subject(request: SubjectGenerationRequest):
     """
     Generate an AI-powered email subject line for job applications.
 
     This endpoint creates compelling email subject lines based on the job
-    description and cover letter content using Gemini AI.
+    description and cover letter content using Gemini AI. Identical
+    requests are served from an in-process cache; the fallback subject
+    used when Gemini fails is never cached.
 
     Request Body:
         - job_title: The job title being applied for
@@ -462,45 +1813,13 @@ async def generate_email_subject(request: SubjectGenerationRequest):
         )
 
     try:
-        # Initialize Gemini model
-        model = genai.GenerativeModel('gemini-2.5-flash')
-
-        # Create subject generation prompt
-        prompt = f"""
-        Generate a professional and compelling email subject line for a job application.
-
-        Job Title: {request.job_title}
-        Company: {request.company}
-        Job Description: {request.job_description}
-        Cover Letter Preview: {request.cover_letter_content[:200]}...
-
-        The subject line should:
-        - Be professional and concise (under 80 characters if possible)
-        - Include the job title and company name
-        - Be compelling and encourage the recruiter to open the email
-        - Sound natural and not spammy
-        - Focus on the candidate's interest and qualifications
-
-        Examples of good subject lines:
-        - "Product Manager Application - Accelify Solutions"
-        - "Experienced PM Interested in [Company] Opportunity"
-        - "Application for [Job Title] Position at [Company]"
-
-        Generate one strong subject line:
-        """
-
-        # Generate subject line
-        response = model.generate_content(prompt)
-        subject = response.text.strip()
-
-        # Clean up the subject (remove quotes if present)
-        subject = subject.strip('"').strip("'").strip()
-
-        # Ensure it's not too long
-        if len(subject) > 100:
-            subject = subject[:97] + "..."
+        subject = await cached_gemini_call(
+            _subject_cache,
+            subject_cache_key(request),
+            lambda: generate_subject_with_gemini(request)
+        )
 
-        print(f"✅ Generated email subject: {subject}")
+        logger.debug("Generated email subject: %s", subject)
 
         return {
             "subject": subject,
@@ -509,43 +1828,74 @@ async def generate_email_subject(request: SubjectGenerationRequest):
         }
 
     except Exception as e:
-        print(f"❌ Subject generation error: {e}")
+        logger.warning("Subject generation error: %s", e)
         # Fallback to a basic subject if AI fails
         fallback_subject = f"Job Application: {request.job_title} at {request.company}"
-        print(f"📧 Using fallback subject: {fallback_subject}")
+        logger.debug("Using fallback subject: %s", fallback_subject)
         return {
             "subject": fallback_subject,
             "job_title": request.job_title,
             "company": request.company
         }
 
-@app.post("/send_email")
-async def send_job_application(request: EmailRequest):
+def load_encoded_attachment(path: str) -> str:
     """
-    Send job application email with cover letter and resume attachment.
+    Return the base64 MIME body for a file, re-encoding only when it changes.
 
-    This endpoint sends an email with the cover letter as body and attaches
-    the resume PDF file to the specified email addresses.
+    The same resume is attached to every application, so the encoded payload
+    is cached per path and reused while the file's (mtime, size) is
+    unchanged. The cache holds at most ATTACHMENT_CACHE_SIZE files. On a
+    miss the file is memory-mapped and encoded straight from the mapping
+    instead of being read into a separate bytes copy first.
 
-    Request Body:
-        - to_emails: List of recipient email addresses
-        - subject: Email subject line
-        - body: Cover letter content
-        - resume_file: Path to resume PDF file (optional)
+    Args:
+        path: Path of the file to attach
 
     Returns:
-        dict: Success message with confirmation details
+        str: Base64 text wrapped at 76 characters, ready for set_payload()
     """
-    if not GMAIL_USER or not GMAIL_APP_PASSWORD:
-        raise HTTPException(
-            status_code=500,
-            detail="Gmail credentials not configured. Please add GMAIL_USER and GMAIL_APP_PASSWORD to .env file."
-        )
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    # Nanosecond mtime: a float mtime can miss a rewrite within the same tick
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _ATTACHMENT_CACHE_LOCK:
+        cached = _ATTACHMENT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(path, 'rb') as attachment:
+        if st.st_size == 0:
+            payload = ""
+        else:
+            with mmap.mmap(attachment.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                payload = base64.encodebytes(mapped).decode('ascii')
+
+    # Replaces any encoding of an older version of the same file
+    with _ATTACHMENT_CACHE_LOCK:
+        _ATTACHMENT_CACHE[key] = (stamp, payload)
+    return payload
+
+def _build_mime(request: EmailRequest) -> tuple[bytes, str]:
+    """
+    Build the job application email and serialize it for SMTP.
+
+    Runs in a worker thread because reading and base64-encoding the resume
+    and flattening the MIME tree are blocking, CPU-bound steps.
+
+    Args:
+        request: Email request with recipients, subject, body and resume path
 
+    Returns:
+        tuple: Serialized message bytes and the attached filename
+        (or "No attachment")
+    """
     # Create email message
     msg = MIMEMultipart()
     msg['From'] = GMAIL_USER
-    msg['To'] = ', '.join(request.to_emails)
+    # Several recipients are addressed Bcc-style: they only appear in the
+    # SMTP envelope, so the header stays one address long and recruiters
+    # don't see which other companies received the application
+    msg['To'] = request.to_emails[0] if len(request.to_emails) == 1 else GMAIL_USER
     msg['Subject'] = request.subject
 
     # Add cover letter as email body
@@ -557,61 +1907,160 @@ async def send_job_application(request: EmailRequest):
         if request.resume_file and os.path.exists(request.resume_file):
             # Get the actual filename for attachment
             actual_filename = os.path.basename(request.resume_file)
-            with open(request.resume_file, 'rb') as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
-                encoders.encode_base64(part)
-                part.add_header('Content-Disposition', f"attachment; filename={actual_filename}")
-                msg.attach(part)
-            print(f"✅ Resume attached: {request.resume_file}")
+            part = MIMEBase('application', 'octet-stream')
+            # Payload is already base64-encoded (and cached), so skip encoders.encode_base64
+            part.set_payload(load_encoded_attachment(request.resume_file))
+            part['Content-Transfer-Encoding'] = 'base64'
+            part.add_header('Content-Disposition', f"attachment; filename={actual_filename}")
+            msg.attach(part)
+            logger.debug("Resume attached: %s", request.resume_file)
             attachment_status = actual_filename
         else:
-            print(f"ℹ️ No resume file attached (MVP mode)")
+            logger.debug("No resume file attached (MVP mode)")
     except PermissionError as e:
-        print(f"⚠️ Permission denied accessing resume file: {e}")
+        logger.warning("Permission denied accessing resume file: %s", e)
     except Exception as e:
-        print(f"⚠️ Error attaching resume file: {e}")
+        logger.warning("Error attaching resume file: %s", e)
+
+    # Flatten straight to bytes: as_string() would build a str copy that
+    # aiosmtplib then re-encodes into a second full-size bytes copy
+    return msg.as_bytes(), attachment_status
+
+class PartialDeliveryError(Exception):
+    """Some recipient envelopes were delivered before a later one failed."""
+
+    def __init__(self, delivered: List[str], failed: List[str], error: Exception):
+        super().__init__(str(error))
+        self.delivered = delivered
+        self.failed = failed
+        self.error = error
+
+async def _send_via_pool(message: bytes, to_emails: List[str]) -> None:
+    """
+    Send a serialized message to every recipient over one pooled connection.
+
+    One envelope per chunk of GMAIL_MAX_RECIPIENTS: no per-recipient
+    handshakes, and Gmail's RCPT limit is respected.
+
+    Args:
+        message: Serialized MIME message
+        to_emails: Recipient addresses
+
+    Raises:
+        PartialDeliveryError: If a later envelope fails after earlier ones
+            were delivered
+        aiosmtplib.SMTPException: If nothing could be delivered
+    """
+    # Reuse a pooled, already-authenticated SMTP connection
+    server = await _acquire_smtp_connection()
+    try:
+        delivered: List[str] = []
+        for i in range(0, len(to_emails), GMAIL_MAX_RECIPIENTS):
+            chunk = to_emails[i:i + GMAIL_MAX_RECIPIENTS]
+            try:
+                result = await server.sendmail(GMAIL_USER, chunk, message)
+            except Exception as e:
+                if not delivered:
+                    raise
+                raise PartialDeliveryError(delivered, to_emails[i:], e) from e
+            delivered.extend(chunk)
+            logger.debug("Envelope accepted for %d recipient(s): %s", len(chunk), result)
+    finally:
+        _smtp_pool.put_nowait(server)
+
+def unique_recipients(to_emails: List[str]) -> List[str]:
+    """
+    Normalize a recipient list: trim, lowercase, drop blanks and duplicates.
+
+    Gmail counts every RCPT against the daily sending quota, so an address
+    listed twice would be charged (and mailed) twice.
+
+    Args:
+        to_emails: Recipient addresses as submitted
+
+    Returns:
+        List of unique addresses in their original order
+
+    Raises:
+        HTTPException: 400 if no recipient is left
+    """
+    recipients = list(dict.fromkeys(email.strip().lower() for email in to_emails if email.strip()))
+    if not recipients:
+        raise HTTPException(status_code=400, detail="No recipients")
+    return recipients
 
-    # Send email via Gmail SMTP (using a more compatible approach for FastAPI)
+@app.post("/send_email")
+async def send_job_application(request: EmailRequest):
+    """
+    Send job application email with cover letter and resume attachment.
+
+    This endpoint sends an email with the cover letter as body and attaches
+    the resume PDF file to the specified email addresses. All recipients
+    share one SMTP transaction; lists longer than Gmail's 100-recipient
+    limit are split into several envelopes on the same pooled connection.
+    With more than one recipient the message is addressed to the sender
+    and every recipient receives it as a blind copy.
+
+    Request Body:
+        - to_emails: List of recipient email addresses (duplicates are
+          sent once; an empty list is rejected with HTTP 400)
+        - subject: Email subject line
+        - body: Cover letter content
+        - resume_file: Path to resume PDF file (optional)
+
+    Returns:
+        dict: Success message with confirmation details. If a later envelope
+        fails after earlier ones were delivered, a 207 response with
+        status "partial" lists the delivered and failed recipients instead.
+    """
+    # Rejected before any SMTP or attachment work is done
+    request.to_emails = unique_recipients(request.to_emails)
+
+    if not GMAIL_USER or not GMAIL_APP_PASSWORD:
+        raise HTTPException(
+            status_code=500,
+            detail="Gmail credentials not configured. Please add GMAIL_USER and GMAIL_APP_PASSWORD to .env file."
+        )
+
+    # Build and serialize the MIME message off the event loop; base64-encoding
+    # a multi-MB resume is CPU work that would otherwise stall other requests
+    message, attachment_status = await asyncio.to_thread(_build_mime, request)
+
+    # Send email via Gmail SMTP without blocking the event loop
     email_sent = False
     error_details = ""
 
     try:
-        print(f"📧 Attempting to send email to: {', '.join(request.to_emails)}")
-        print(f"📧 Subject: {request.subject}")
-        print(f"📧 Gmail User: {GMAIL_USER}")
-
-        # Validate credentials before attempting connection
-        if len(GMAIL_APP_PASSWORD) != 16:
-            print(f"⚠️ App Password length issue: {len(GMAIL_APP_PASSWORD)} characters (expected 16)")
-        if ' ' in GMAIL_APP_PASSWORD:
-            print("⚠️ App Password contains spaces")
-
-        # Create SMTP connection (use context manager for better cleanup)
-        print("🔗 Connecting to Gmail SMTP...")
-        with smtplib.SMTP('smtp.gmail.com', 587) as server:
-            # Set timeout to prevent hanging
-            server.timeout = 30
-
-            print("🔒 Starting TLS...")
-            server.starttls()
-
-            print("🔑 Attempting login...")
-            server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
-            print("✅ SMTP authentication successful")
-
-            # Send email
-            text = msg.as_string()
-            print(f"📤 Sending email to {len(request.to_emails)} recipient(s)...")
-            print(f"📤 Email content length: {len(text)} characters")
-
-            result = server.sendmail(GMAIL_USER, request.to_emails, text)
-            print(f"✅ Email sent successfully! Server response: {result}")
-            email_sent = True
-
-    except smtplib.SMTPAuthenticationError as e:
+        logger.debug("Sending email from %s to %d recipient(s), subject: %s, %d characters",
+                     GMAIL_USER, len(request.to_emails), request.subject, len(message))
+
+        await _send_via_pool(message, request.to_emails)
+        email_sent = True
+        logger.info("Email sent to %d recipient(s)", len(request.to_emails),
+                    extra={"recipients": len(request.to_emails), "subject": request.subject})
+
+    except PartialDeliveryError as e:
+        # Earlier envelopes already went out; a plain error would invite a
+        # retry that mails those recipients twice
+        logger.warning("Email partially sent: %d delivered, %d failed: %s",
+                       len(e.delivered), len(e.failed), e.error)
+        return ORJSONResponse(
+            status_code=207,
+            content={
+                "success": False,
+                "message": f"Email sent to {len(e.delivered)} of {len(request.to_emails)} recipient(s)",
+                "status": "partial",
+                "to": request.to_emails,
+                "subject": request.subject,
+                "delivered": e.delivered,
+                "failed": e.failed,
+                "attachment": attachment_status,
+                "details": f"Failed to send email: {e.error}"
+            }
+        )
+    except aiosmtplib.SMTPAuthenticationError as e:
         error_details = f"Authentication failed: {e}"
-        print(f"❌ Authentication error: {error_details}")
+        logger.warning("Gmail authentication error: %s", error_details)
 
         # Provide detailed troubleshooting information
         raise HTTPException(
@@ -623,23 +2072,23 @@ async def send_job_application(request: EmailRequest):
                    "4. Update GMAIL_USER and GMAIL_APP_PASSWORD in .env file\n"
                    f"Error details: {error_details}"
         )
-    except smtplib.SMTPRecipientsRefused as e:
+    except aiosmtplib.SMTPRecipientsRefused as e:
         error_details = f"Recipients refused: {e}"
-        print(f"❌ Recipients refused: {error_details}")
+        logger.warning("Email recipients refused: %s", error_details)
         raise HTTPException(
             status_code=500,
             detail=f"Email recipients refused the message: {error_details}"
         )
-    except smtplib.SMTPServerDisconnected as e:
+    except aiosmtplib.SMTPServerDisconnected as e:
         error_details = f"Server disconnected: {e}"
-        print(f"❌ Server disconnected: {error_details}")
+        logger.warning("Email server disconnected: %s", error_details)
         raise HTTPException(
             status_code=500,
             detail=f"Email server disconnected: {error_details}"
         )
     except Exception as e:
         error_details = f"Unexpected error: {e}"
-        print(f"❌ Unexpected email error: {error_details}")
+        logger.warning("Unexpected email error: %s", error_details)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to send email: {error_details}"
@@ -658,4 +2107,100 @@ async def send_job_application(request: EmailRequest):
         "demo_mode": not email_sent,
         "attachment": attachment_status,
         "details": f"Email {status} to {len(request.to_emails)} recipient(s) with subject: '{request.subject}'"
-    }
\ No newline at end of file
+    }
+
+@retry(
+    retry=retry_if_exception_type(aiosmtplib.SMTPServerDisconnected),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+async def _send_via_pool_with_retry(message: bytes, to_emails: List[str]) -> None:
+    """
+    _send_via_pool, retried with exponential backoff if Gmail disconnects.
+
+    Only retried while nothing has been delivered (partial deliveries raise
+    PartialDeliveryError instead), so no recipient is mailed twice.
+    """
+    await _send_via_pool(message, to_emails)
+
+async def _send_in_background(task_id: str, message: bytes, to_emails: List[str], subject: str) -> None:
+    """Deliver a queued /send_email/background message and record the outcome."""
+    task = _email_tasks.get(task_id, {})
+    task["status"] = "sending"
+    try:
+        await _send_via_pool_with_retry(message, to_emails)
+    except PartialDeliveryError as e:
+        logger.warning("Background email partially sent: %d delivered, %d failed: %s",
+                       len(e.delivered), len(e.failed), e.error)
+        task.update(status="partial", delivered=e.delivered, failed=e.failed, error=str(e.error))
+    except Exception as e:
+        logger.warning("Background email failed: %s", e)
+        task.update(status="failed", error=str(e))
+    else:
+        logger.info("Email sent to %d recipient(s)", len(to_emails),
+                    extra={"recipients": len(to_emails), "subject": subject})
+        task["status"] = "sent"
+
+@app.post("/send_email/background", status_code=202)
+async def send_job_application_background(request: EmailRequest, background_tasks: BackgroundTasks):
+    """
+    Queue a job application email and return before it is delivered.
+
+    Same input as /send_email. The message is built before responding (so
+    attachment problems are still reported), then handed to a background
+    task that sends it over the pooled SMTP connection after the response
+    has gone out, retrying with backoff if Gmail drops the connection.
+    Poll GET /send_email/{task_id} for the outcome.
+
+    Request Body:
+        - to_emails: List of recipient email addresses
+        - subject: Email subject line
+        - body: Cover letter content
+        - resume_file: Path to resume PDF file (optional)
+
+    Returns:
+        dict: 202 Accepted with the task id and status "queued"
+    """
+    request.to_emails = unique_recipients(request.to_emails)
+
+    if not GMAIL_USER or not GMAIL_APP_PASSWORD:
+        raise HTTPException(
+            status_code=500,
+            detail="Gmail credentials not configured. Please add GMAIL_USER and GMAIL_APP_PASSWORD to .env file."
+        )
+
+    message, attachment_status = await asyncio.to_thread(_build_mime, request)
+
+    task_id = uuid.uuid4().hex
+    _email_tasks[task_id] = {
+        "task_id": task_id,
+        "status": "queued",
+        "to": request.to_emails,
+        "subject": request.subject,
+        "attachment": attachment_status
+    }
+    background_tasks.add_task(_send_in_background, task_id, message, request.to_emails, request.subject)
+
+    return {
+        "success": True,
+        "message": "Email queued for sending",
+        **_email_tasks[task_id]
+    }
+
+@app.get("/send_email/{task_id}")
+async def get_email_task(task_id: str):
+    """
+    Report the status of a /send_email/background job.
+
+    Args:
+        task_id: Id returned by /send_email/background
+
+    Returns:
+        dict: Task record with status "queued", "sending", "sent",
+        "partial" (with delivered/failed lists) or "failed" (with error)
+    """
+    task = _email_tasks.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired email task: {task_id}")
+    return task
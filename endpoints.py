@@ -0,0 +1,29 @@
+"""
+Backend URLs and the shared HTTP session used by the test scripts
+URLs are built once at import; the session keeps connections alive and
+retries briefly while the backend is restarting
+"""
+
+import requests
+from urllib3.util import Retry
+
+BASE_URL = 'http://127.0.0.1:8000'
+
+HEALTH = f'{BASE_URL}/health'
+EXTRACT_TEXT = f'{BASE_URL}/extract_text'
+SEARCH_JOBS = f'{BASE_URL}/search_jobs'
+GENERATE_COVER = f'{BASE_URL}/generate_cover'
+GENERATE_SUBJECT = f'{BASE_URL}/generate_subject'
+SEND_EMAIL = f'{BASE_URL}/send_email'
+
+# Bodies are pre-encoded with orjson and sent as raw bytes
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Refused connections are retried for every method. Gateway errors are only
+# retried for idempotent methods (urllib3's default), so a POST /send_email
+# is never sent twice.
+RETRY = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+
+# One keep-alive session, so every call reuses the same TCP connection
+SESSION = requests.Session()
+SESSION.mount('http://', requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=RETRY))
@@ -5,8 +5,10 @@
  * with the FastAPI backend to fetch AI-generated job listings.
  *
  * Backend Connection:
- * - Uses fetch API to make POST requests to the /search_jobs endpoint
+ * - Uses fetch API to make POST requests to the /search_jobs/stream endpoint
  * - Sends form data as JSON with Content-Type: application/json
+ * - Reads the newline-delimited JSON response incrementally so each job
+ *   card is rendered as soon as the AI finishes generating it
  * - Backend URL is configurable (currently set to port 8001)
  * - Handles both success and error responses from the API
  */
@@ -22,7 +24,7 @@ const jobsTableBody = document.getElementById('jobsTableBody');
 const API_CONFIG = {
     // Update this URL to match your backend server (CORS-enabled server)
     BASE_URL: 'http://127.0.0.1:8000',
-    ENDPOINT: '/search_jobs',
+    ENDPOINT: '/search_jobs/stream',
     TIMEOUT: 30000 // 30 seconds for AI API calls
 };
 
@@ -68,11 +70,16 @@ async function handleFormSubmit(event) {
     showLoading();
 
     try {
-        // Make API call to backend
-        const jobs = await searchJobs(formData);
+        // Make API call to backend, rendering each job as it streams in
+        const jobs = await searchJobs(formData, (job, index) => {
+            hideLoading();
+            jobsTableBody.appendChild(createJobRow(job, index));
+        });
 
-        // Display results
-        displayJobResults(jobs);
+        if (jobs.length === 0) {
+            showNoResults();
+        }
+        console.log(`✅ Displayed ${jobs.length} job results`);
 
     } catch (error) {
         console.error('❌ Search error:', error);
@@ -111,9 +118,10 @@ function validateFormData(formData) {
 /**
  * Search for jobs using the backend API
  * @param {Object} searchData - Search criteria
- * @returns {Promise<Array>} Array of job objects
+ * @param {Function} onJob - Called with (job, index) as each job arrives
+ * @returns {Promise<Array>} Array of all received job objects
  */
-async function searchJobs(searchData) {
+async function searchJobs(searchData, onJob) {
     const response = await fetch(`${API_CONFIG.BASE_URL}${API_CONFIG.ENDPOINT}`, {
         method: 'POST',
         headers: {
@@ -141,31 +149,36 @@ async function searchJobs(searchData) {
         throw new Error(errorMessage);
     }
 
-    // Parse and return JSON response
-    const jobs = await response.json();
-    return jobs;
-}
+    // Parse the NDJSON stream line by line as chunks arrive
+    const jobs = [];
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
 
-/**
- * Display job results in the table
- * @param {Array} jobs - Array of job objects
- */
-function displayJobResults(jobs) {
-    // Clear existing rows
-    jobsTableBody.innerHTML = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
 
-    if (!jobs || jobs.length === 0) {
-        showNoResults();
-        return;
-    }
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop(); // Keep the incomplete trailing line
 
-    // Create table rows for each job
-    jobs.forEach((job, index) => {
-        const row = createJobRow(job, index);
-        jobsTableBody.appendChild(row);
-    });
+        for (const line of lines) {
+            if (!line.trim()) {
+                continue;
+            }
+            const job = JSON.parse(line);
+            if (job.error) {
+                throw new Error(job.error);
+            }
+            onJob(job, jobs.length);
+            jobs.push(job);
+        }
+    }
 
-    console.log(`✅ Displayed ${jobs.length} job results`);
+    return jobs;
 }
 
 /**
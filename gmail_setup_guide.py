@@ -31,7 +31,7 @@ def show_gmail_setup_guide():
     print("4. Select 'Other (custom name)' as the device")
     print("5. Enter 'JobAI Applier MVP' as the custom name")
     print("6. Click 'Generate'")
-    print("7. Copy the 16-character password (e.g., 'abcd-efgh-ijkl-mnop')")
+    print("7. Copy the 16-character password (e.g., 'abcd efgh ijkl mnop')")
     print()
 
     print("STEP 3: Update .env File")
@@ -39,12 +39,12 @@ def show_gmail_setup_guide():
     print("Update these values in your .env file:")
     print()
     print("GMAIL_USER=your-email@gmail.com")
-    print("GMAIL_APP_PASSWORD=your-16-character-app-password")
+    print("GMAIL_APP_PASSWORD=abcdefghijklmnop")
     print()
     print("IMPORTANT:")
     print("- Use your full Gmail address (including @gmail.com)")
     print("- Use the App Password, NOT your regular password")
-    print("- Make sure there are no spaces in the App Password")
+    print("- The App Password must be exactly 16 letters (spaces are removed automatically)")
     print("- Do NOT include quotes around the password")
     print()
 
@@ -4,52 +4,140 @@ Simple HTTP server to serve the frontend files
 This allows the frontend to make API calls to the backend without CORS issues
 """
 
-import http.server
-import socketserver
+import mimetypes
+import re
+import socket
+import threading
 import webbrowser
 import os
 from pathlib import Path
 
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import FileResponse, Response
+from starlette.routing import Mount
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
 # Configuration
 FRONTEND_PORT = 8081  # Changed from 8080 to avoid port conflicts
 FRONTEND_DIR = Path(__file__).parent / "frontend"
+PREFLIGHT_MAX_AGE = 600  # seconds browsers may reuse a preflight; Chromium's cap
+
+# Content-hashed asset names (e.g. app.3f9c2b1a.js) never change content
+FINGERPRINTED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.(?:js|css|woff2?|png|jpg|svg)$")
+
+# Pre-compressed siblings (app.js.br, app.js.gz), in order of preference
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+class CachingStaticFiles(StaticFiles):
+    """StaticFiles that also tells the browser how long it may keep each file"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = (
+            self.precompressed_response(full_path, scope, status_code)
+            or super().file_response(full_path, stat_result, scope, status_code)
+        )
+        # Also applied to 304 responses, which copy Cache-Control through
+        if FINGERPRINTED_ASSET.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            # Unhashed files can change under the same name: always revalidate,
+            # which costs a 304 via the ETag rather than a re-download
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    def precompressed_response(self, full_path, scope, status_code):
+        """Serve a .br/.gz sibling as-is if the client accepts it, else None"""
+        request_headers = Headers(scope=scope)
+        accepted = request_headers.get("accept-encoding", "")
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            if encoding not in accepted:
+                continue
+            variant_path = f"{full_path}{suffix}"
+            try:
+                variant_stat = os.stat(variant_path)
+            except OSError:
+                continue
+
+            # GZipMiddleware leaves responses with a Content-Encoding alone
+            response = FileResponse(
+                variant_path,
+                status_code=status_code,
+                stat_result=variant_stat,
+                method=scope["method"],
+                media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
 
-class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=FRONTEND_DIR, **kwargs)
+class NoContentCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that answers accepted preflights with 204 instead of 200 "OK" """
 
-    def end_headers(self):
-        # Add CORS headers to allow API calls to backend
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        super().end_headers()
+    def preflight_response(self, request_headers):
+        response = super().preflight_response(request_headers)
+        if response.status_code != 200:
+            return response
+        # Same CORS headers, without the body and its entity headers
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key not in ("content-length", "content-type")
+        }
+        return Response(status_code=204, headers=headers)
 
-    def do_OPTIONS(self):
-        self.send_response(200)
-        self.end_headers()
+# Static frontend (index.html for "/"), with CORS headers to allow API calls
+# to backend. Preflights are answered by the middleware and cacheable.
+app = Starlette(
+    routes=[Mount("/", app=CachingStaticFiles(directory=FRONTEND_DIR, html=True))],
+    middleware=[
+        Middleware(
+            NoContentCORSMiddleware,
+            allow_origins=["*"],
+            allow_methods=["GET", "POST", "OPTIONS"],
+            allow_headers=["Content-Type"],
+            max_age=PREFLIGHT_MAX_AGE,
+        ),
+        # Text assets shrink 3-5x; anything without a pre-compressed
+        # sibling is gzipped per response (well under 1 ms for script.js)
+        Middleware(GZipMiddleware, minimum_size=1024, compresslevel=6),
+    ],
+)
 
 def serve_frontend():
     """Start the frontend server"""
     try:
-        with socketserver.TCPServer(("", FRONTEND_PORT), CustomHTTPRequestHandler) as httpd:
-            print(f"🚀 Frontend server running at: http://localhost:{FRONTEND_PORT}")
-            print(f"📂 Serving files from: {FRONTEND_DIR}")
-            print(f"🔗 Backend API available at: http://127.0.0.1:8000")
-            print("📋 API Documentation at: http://127.0.0.1:8000/docs")
-            print("\n💡 Open http://localhost:8080 in your browser to use the app")
-            print("🔄 Press Ctrl+C to stop the server")
+        # Bind up front so a busy port is reported here, not deep inside uvicorn
+        sock = socket.create_server(("", FRONTEND_PORT))
+    except OSError as e:
+        print(f"❌ Error starting server: {e}")
+        print(f"💡 Try changing the port or check if port {FRONTEND_PORT} is already in use")
+        return
 
-            # Open browser automatically
-            webbrowser.open(f'http://localhost:{FRONTEND_PORT}')
+    print(f"🚀 Frontend server running at: http://localhost:{FRONTEND_PORT}")
+    print(f"📂 Serving files from: {FRONTEND_DIR}")
+    print(f"🔗 Backend API available at: http://127.0.0.1:8000")
+    print("📋 API Documentation at: http://127.0.0.1:8000/docs")
+    print(f"\n💡 Open http://localhost:{FRONTEND_PORT} in your browser to use the app")
+    print("🔄 Press Ctrl+C to stop the server")
 
-            httpd.serve_forever()
+    # Open browser automatically. xdg-open/osascript can take several hundred
+    # ms, so launch it from a timer thread instead of delaying server start
+    threading.Timer(0.2, webbrowser.open, args=(f'http://localhost:{FRONTEND_PORT}',)).start()
 
+    # Every asset request is served on one asyncio event loop; uvicorn uses
+    # uvloop and httptools automatically where they are installed
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning"))
+    try:
+        server.run(sockets=[sock])
     except KeyboardInterrupt:
-        print("\n🛑 Frontend server stopped")
-    except OSError as e:
-        print(f"❌ Error starting server: {e}")
-        print(f"💡 Try changing the port or check if port {FRONTEND_PORT} is already in use")
+        pass
+    print("\n🛑 Frontend server stopped")
 
 if __name__ == "__main__":
     serve_frontend()
\ No newline at end of file
@@ -3,13 +3,22 @@
 Test script specifically for resume PDF attachment functionality
 """
 
+import base64
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import orjson
 import requests
 
+import endpoints
+from endpoints import JSON_HEADERS, SESSION
+
 def test_attachment_functionality():
     """Test that resume PDF attachment is working properly"""
 
-    base_url = 'http://127.0.0.1:8000'
-
     print("Testing Resume PDF Attachment Functionality")
     print("=" * 50)
 
@@ -25,16 +34,17 @@ def test_attachment_functionality():
         print(f"Sending email with attachment to: {test_payload['to_emails']}")
         print(f"Resume file: {test_payload['resume_file']}")
 
-        response = requests.post(
-            f'{base_url}/send_email',
-            json=test_payload,
+        response = SESSION.post(
+            endpoints.SEND_EMAIL,
+            data=orjson.dumps(test_payload),
+            headers=JSON_HEADERS,
             timeout=30
         )
 
         print(f"\nResponse Status: {response.status_code}")
 
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             print("SUCCESS: Email sent successfully!")
             print(f"Subject: {response_data.get('subject')}")
             print(f"Attachment: {response_data.get('attachment')}")
@@ -53,7 +63,7 @@ def test_attachment_functionality():
 
     except requests.exceptions.ConnectionError:
         print("ERROR: Cannot connect to backend server")
-        print(f"Make sure the server is running on {base_url}")
+        print(f"Make sure the server is running on {endpoints.BASE_URL}")
         return False
     except requests.exceptions.Timeout:
         print("ERROR: Request timed out")
@@ -62,7 +72,33 @@ def test_attachment_functionality():
         print(f"ERROR: Unexpected error: {e}")
         return False
 
+def test_attachment_encoded_once():
+    """The backend encodes a resume once and reuses it until the file changes (no server needed)"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+    import main
+
+    with tempfile.TemporaryDirectory() as tmp:
+        resume = Path(tmp) / "Resume.pdf"
+        resume.write_bytes(b"%PDF-1.4 resume v1\n" * 1000)
+
+        first = main.load_encoded_attachment(str(resume))
+        assert base64.b64decode(first) == resume.read_bytes()
+
+        # Every later application reuses the cached payload without reading the file
+        with mock.patch.object(main.mmap, "mmap", side_effect=AssertionError("resume re-read")):
+            for _ in range(3):
+                assert main.load_encoded_attachment(str(resume)) is first
+
+        # Editing the resume invalidates the cached payload, even at the same size
+        mtime_ns = resume.stat().st_mtime_ns
+        resume.write_bytes(b"%PDF-1.4 resume v2\n" * 1000)
+        os.utime(resume, ns=(mtime_ns + 1000, mtime_ns + 1000))
+        assert base64.b64decode(main.load_encoded_attachment(str(resume))) == resume.read_bytes()
+
+    print("SUCCESS: Resume is encoded once and re-encoded only after it changes")
+
 if __name__ == "__main__":
+    test_attachment_encoded_once()
     success = test_attachment_functionality()
 
     if success:
@@ -4,105 +4,138 @@ Test script for the complete JobAI Applier MVP workflow
 Tests: Job Search -> Cover Letter Generation -> Email Sending
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import orjson
 import requests
-import json
+
+import endpoints
+from endpoints import JSON_HEADERS, SESSION
+
+# Cover letters and emails for different jobs are independent network calls
+MAX_WORKERS = 8
+RESUME_TEXT = 'Experienced Product Manager with 5+ years in SaaS, led cross-functional teams, launched successful products serving 100K+ users.'
+
+def emit(*lines):
+    """Write a step's status lines with one write call instead of one print each"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+class StepFailed(Exception):
+    """A workflow step got a non-200 response from the backend"""
+
+def apply_to_job(job):
+    """Generate a cover letter for one job and email it; returns (cover_letter, email_data)"""
+    cover_response = SESSION.post(
+        endpoints.GENERATE_COVER,
+        data=orjson.dumps({
+            'job_title': job['title'],
+            'company': job['company'],
+            'resume_text': RESUME_TEXT
+        }),
+        headers=JSON_HEADERS,
+        timeout=30
+    )
+
+    if cover_response.status_code != 200:
+        raise StepFailed(f"Cover letter generation failed: {cover_response.status_code}\nError: {cover_response.text}")
+
+    cover_letter = orjson.loads(cover_response.content)['cover_letter']
+
+    email_response = SESSION.post(
+        endpoints.SEND_EMAIL,
+        data=orjson.dumps({
+            'to_emails': [job['emails']],
+            'subject': f'Job Application: {job["title"]} at {job["company"]}',
+            'body': cover_letter
+            # No resume_file for demo
+        }),
+        headers=JSON_HEADERS,
+        timeout=30
+    )
+
+    if email_response.status_code != 200:
+        raise StepFailed(f"Email sending failed: {email_response.status_code}\nError: {email_response.text}")
+
+    return cover_letter, orjson.loads(email_response.content)
 
 def test_complete_workflow():
     """Test the complete workflow from job search to email sending"""
 
-    base_url = 'http://127.0.0.1:8000'
-
-    print("🚀 Testing Complete JobAI Applier MVP Workflow")
-    print("=" * 50)
+    emit("🚀 Testing Complete JobAI Applier MVP Workflow", "=" * 50, "", "1️⃣ Testing Job Search...")
 
     try:
         # Step 1: Search for jobs
-        print("\n1️⃣ Testing Job Search...")
-        job_response = requests.post(
-            f'{base_url}/search_jobs',
-            json={
+        job_response = SESSION.post(
+            endpoints.SEARCH_JOBS,
+            data=orjson.dumps({
                 'title': 'Product Manager',
                 'location': 'Bangalore',
                 'ctc': '15-25 LPA'
-            },
+            }),
+            headers=JSON_HEADERS,
             timeout=30
         )
 
         if job_response.status_code != 200:
-            print(f"❌ Job search failed: {job_response.status_code}")
-            print(f"Error: {job_response.text}")
+            emit(f"❌ Job search failed: {job_response.status_code}", f"Error: {job_response.text}")
             return
 
-        jobs = job_response.json()
-        print(f"✅ Found {len(jobs)} jobs")
-
+        jobs = orjson.loads(job_response.content)
         if not jobs:
-            print("❌ No jobs returned")
+            emit(f"✅ Found {len(jobs)} jobs", "❌ No jobs returned")
             return
 
-        # Step 2: Generate cover letter for first job
-        print(f"\n2️⃣ Testing Cover Letter Generation...")
-        first_job = jobs[0]
-
-        cover_response = requests.post(
-            f'{base_url}/generate_cover',
-            json={
-                'job_title': first_job['title'],
-                'company': first_job['company'],
-                'resume_text': 'Experienced Product Manager with 5+ years in SaaS, led cross-functional teams, launched successful products serving 100K+ users.'
-            },
-            timeout=30
+        # Steps 2 and 3 for every job at once: N jobs take about as long as one
+        emit(
+            f"✅ Found {len(jobs)} jobs",
+            "",
+            f"2️⃣ 3️⃣ Testing Cover Letter Generation and Email Sending (Demo Mode) for {len(jobs)} jobs..."
         )
-
-        if cover_response.status_code != 200:
-            print(f"❌ Cover letter generation failed: {cover_response.status_code}")
-            print(f"Error: {cover_response.text}")
+        failed = 0
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {executor.submit(apply_to_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    cover_letter, email_data = future.result()
+                except StepFailed as e:
+                    failed += 1
+                    emit("", f"❌ {job['title']} at {job['company']}: {e}")
+                    continue
+
+                # One write per job keeps each job's lines together
+                emit(
+                    "",
+                    f"✅ {job['title']} at {job['company']}",
+                    f"📄 Generated {len(cover_letter)} character cover letter: {cover_letter[:100]}...",
+                    f"📧 {email_data['message']} Would send to: {', '.join(email_data['to'])}",
+                    f"📧 Subject: {email_data['subject']}"
+                )
+
+        if failed:
+            emit("", f"❌ {failed} of {len(jobs)} applications failed")
             return
 
-        cover_data = cover_response.json()
-        cover_letter = cover_data['cover_letter']
-        print(f"✅ Generated {len(cover_letter)} character cover letter")
-        print(f"📄 Cover letter preview: {cover_letter[:100]}...")
-
-        # Step 3: Send email (demo mode)
-        print(f"\n3️⃣ Testing Email Sending (Demo Mode)...")
-        email_response = requests.post(
-            f'{base_url}/send_email',
-            json={
-                'to_emails': [first_job['emails']],
-                'subject': f'Job Application: {first_job["title"]} at {first_job["company"]}',
-                'body': cover_letter
-                # No resume_file for demo
-            },
-            timeout=30
-        )
-
-        if email_response.status_code != 200:
-            print(f"❌ Email sending failed: {email_response.status_code}")
-            print(f"Error: {email_response.text}")
-            return
-
-        email_data = email_response.json()
-        print(f"✅ Email demo completed: {email_data['message']}")
-        print(f"📧 Would send to: {', '.join(email_data['to'])}")
-        print(f"📧 Subject: {email_data['subject']}")
-        print(f"📧 Demo mode: {email_data.get('demo_mode', 'False')}")
-
         # Success summary
-        print("\n🎉 Complete Workflow Test: SUCCESS!")
-        print("=" * 50)
-        print("✅ Job Search: Working")
-        print("✅ Cover Letter Generation: Working")
-        print("✅ Email Sending (Demo): Working")
-        print("\n🚀 Your JobAI Applier MVP is ready for frontend testing!")
+        emit(
+            "",
+            "🎉 Complete Workflow Test: SUCCESS!",
+            "=" * 50,
+            "✅ Job Search: Working",
+            "✅ Cover Letter Generation: Working",
+            "✅ Email Sending (Demo): Working",
+            "",
+            "🚀 Your JobAI Applier MVP is ready for frontend testing!"
+        )
 
     except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to backend server")
-        print(f"💡 Make sure the server is running on {base_url}")
+        emit("❌ Cannot connect to backend server", f"💡 Make sure the server is running on {endpoints.BASE_URL}")
     except requests.exceptions.Timeout:
-        print("❌ Request timed out")
+        emit("❌ Request timed out")
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        emit(f"❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
     test_complete_workflow()
\ No newline at end of file
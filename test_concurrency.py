@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent Gemini code paths (no server or API key needed)
+Gemini is replaced by a fake model whose calls take FAKE_LATENCY seconds
+Run with pytest or directly: python test_concurrency.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+import main
+
+FAKE_LATENCY = 0.2
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+class FakeResponse:
+    """Mimics a Gemini response: .text for plain calls, async iteration when streamed"""
+
+    def __init__(self, text):
+        self.text = text
+        self.usage_metadata = None
+
+    def __aiter__(self):
+        async def chunks():
+            for i in range(0, len(self.text), 16):
+                await asyncio.sleep(0.005)
+                yield FakeChunk(self.text[i:i + 16])
+        return chunks()
+
+class FakeGeminiModel:
+    """Answers job-search and cover-letter prompts after a simulated network delay"""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_content_async(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        await asyncio.sleep(FAKE_LATENCY)
+        job = {"company": "Fake Labs", "title": "PM", "description": "d", "emails": "hr@fake.com", "phone": "+91-80-0000-0000"}
+        if "numbered job searches" in prompt:
+            count = prompt.count(" position in ")
+            return FakeResponse(json.dumps([{"index": i, "jobs": [job]} for i in range(count)]))
+        if "job postings" in prompt:
+            return FakeResponse(json.dumps([job]))
+        return FakeResponse("Dear Hiring Manager, ...")
+
+def run_with_fake_gemini(scenario):
+    """Run an async scenario against a fresh fake model and a running micro-batcher"""
+    async def runner():
+        model = FakeGeminiModel()
+        main.GEMINI_API_KEY, main.GEMINI_MODEL = "test-key", model
+        main._job_search_cache.clear()
+        main._cover_letter_cache.clear()
+        await main.start_job_search_batcher()
+        try:
+            return await scenario(model)
+        finally:
+            await main.stop_job_search_batcher()
+
+    return asyncio.run(runner())
+
+async def timed(awaitable):
+    """Await something and return (result, seconds taken)"""
+    started = time.perf_counter()
+    result = await awaitable
+    return result, time.perf_counter() - started
+
+async def probe_health():
+    """Yield to the event loop once, then hit /health, as a concurrent client would"""
+    await asyncio.sleep(0.01)
+    return await main.health_check()
+
+def test_health_responsive_during_batch_request():
+    """/search_jobs_batch awaits Gemini without blocking the event loop"""
+    async def scenario(model):
+        request = main.JobSearchBatchRequest(queries=[
+            main.JobSearchRequest(title="PM", location="Pune"),
+            main.JobSearchRequest(title="Analyst", location="Delhi"),
+        ])
+        batch = asyncio.create_task(main.search_jobs_batch(request))
+        health, health_time = await timed(probe_health())
+        results = await batch
+        return health, health_time, results, len(model.prompts)
+
+    health, health_time, results, calls = run_with_fake_gemini(scenario)
+    assert health == {"status": "MVP ready"}
+    assert health_time < FAKE_LATENCY / 2, f"/health waited {health_time:.3f}s behind the batch"
+    assert [len(jobs) for jobs in results] == [1, 1]
+    assert calls == 1
+
+def test_micro_batcher_groups_concurrent_searches():
+    """Concurrent /search_jobs calls share one Gemini call and never stall /health"""
+    async def scenario(model):
+        requests = [main.JobSearchRequest(title=f"Role {i}", location="Bangalore") for i in range(5)]
+        searches = asyncio.gather(*(main.search_jobs(request) for request in requests))
+        health, health_time = await timed(probe_health())
+        results = await searches
+        return health, health_time, results, len(model.prompts)
+
+    health, health_time, results, calls = run_with_fake_gemini(scenario)
+    assert health == {"status": "MVP ready"}
+    assert health_time < FAKE_LATENCY / 2, f"/health waited {health_time:.3f}s behind the batch"
+    assert [len(jobs) for jobs in results] == [1] * 5
+    assert calls == 1, f"expected one batched Gemini call, got {calls}"
+
+def test_apply_prep_overlaps_gemini_calls():
+    """/apply_prep takes about as long as the slower call, not the sum of both"""
+    async def scenario(model):
+        request = main.ApplyPrepRequest(
+            search=main.JobSearchRequest(title="PM", location="Mumbai"),
+            cover=main.CoverLetterRequest(job_title="PM", company="Fake Labs", resume_text="5 years in fintech"),
+        )
+        result, elapsed = await timed(main.apply_prep(request))
+        return result, elapsed, len(model.prompts)
+
+    result, elapsed, calls = run_with_fake_gemini(scenario)
+    assert len(result["jobs"]) == 1
+    assert result["cover_letter"].startswith("Dear Hiring Manager")
+    assert calls == 2
+    assert elapsed < FAKE_LATENCY * 1.75, f"calls ran back to back ({elapsed:.3f}s)"
+
+def test_streamed_call_holds_slot_until_read():
+    """A streamed Gemini call counts against GEMINI_MAX_CONCURRENCY until it is fully read"""
+    async def scenario(model):
+        semaphore = main._gemini_semaphore
+        free = semaphore._value
+        response = await main.generate_gemini_content("Write a cover letter", stream=True)
+        held = semaphore._value
+        text = "".join([chunk.text async for chunk in response])
+        return free, held, semaphore._value, text
+
+    free, held, after, text = run_with_fake_gemini(scenario)
+    assert held == free - 1, "slot released before the stream was read"
+    assert after == free, "slot not released after the stream was read"
+    assert text.startswith("Dear Hiring Manager")
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\nAll {len(tests)} concurrency tests PASSED!")
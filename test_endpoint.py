@@ -4,8 +4,11 @@ Test script for the /search_jobs endpoint
 Run this after restarting the server with updated code
 """
 
+import orjson
 import requests
-import json
+
+import endpoints
+from endpoints import JSON_HEADERS, SESSION
 
 def test_search_jobs():
     """Test the search_jobs endpoint with sample data"""
@@ -19,18 +22,19 @@ def test_search_jobs():
 
     try:
         # Make request to the endpoint (CORS-enabled server with Gemini AI)
-        response = requests.post(
-            'http://127.0.0.1:8000/search_jobs',
-            json=test_payload,
+        response = SESSION.post(
+            endpoints.SEARCH_JOBS,
+            data=orjson.dumps(test_payload),
+            headers=JSON_HEADERS,
             timeout=30  # Increased timeout for AI API calls
         )
 
         print(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
-            jobs = response.json()
+            jobs = orjson.loads(response.content)
             print(f"✅ Success! Found {len(jobs)} jobs:")
-            print(json.dumps(jobs, indent=2))
+            print(orjson.dumps(jobs, option=orjson.OPT_INDENT_2).decode())
 
             # Validate response structure
             for i, job in enumerate(jobs):
@@ -45,7 +49,7 @@ def test_search_jobs():
             print(f"❌ Error: {response.text}")
 
     except requests.exceptions.ConnectionError:
-        print("❌ Cannot connect to server. Make sure it's running on http://127.0.0.1:8000")
+        print(f"❌ Cannot connect to server. Make sure it's running on {endpoints.BASE_URL}")
     except requests.exceptions.Timeout:
         print("❌ Request timed out")
     except Exception as e:
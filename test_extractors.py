@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for the PDF and DOCX text extractors (no server or API key needed)
+Run with pytest or directly: python test_extractors.py
+"""
+
+import io
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from main import extract_text_from_docx, extract_text_from_pdf
+
+UPLOADS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads")
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+
+def build_docx(body_xml):
+    """Zip a word/document.xml with the given <w:body> content into DOCX bytes"""
+    document = f'<?xml version="1.0" encoding="UTF-8"?><w:document {W} {MC}><w:body>{body_xml}</w:body></w:document>'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as docx_zip:
+        docx_zip.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+def paragraph(*runs):
+    return "<w:p>" + "".join(f"<w:r><w:t xml:space=\"preserve\">{run}</w:t></w:r>" for run in runs) + "</w:p>"
+
+def text_box(inner_xml):
+    """A text box as Word writes it: DrawingML under mc:Choice, a VML copy under mc:Fallback"""
+    return (
+        "<w:r><mc:AlternateContent>"
+        f"<mc:Choice Requires=\"wps\"><w:drawing><w:txbxContent>{inner_xml}</w:txbxContent></w:drawing></mc:Choice>"
+        f"<mc:Fallback><w:pict><w:txbxContent>{inner_xml}</w:txbxContent></w:pict></mc:Fallback>"
+        "</mc:AlternateContent></w:r>"
+    )
+
+def test_docx_paragraphs_tabs_and_breaks():
+    body = (
+        paragraph("Dear Hiring Manager,")
+        + "<w:p><w:r><w:t>Skills:</w:t><w:tab/><w:t>SQL</w:t><w:br/><w:t>Python</w:t></w:r></w:p>"
+    )
+    assert extract_text_from_docx(build_docx(body)) == "Dear Hiring Manager,\nSkills:\tSQL\nPython"
+
+def test_docx_text_box_read_once_without_mixing_paragraphs():
+    """The Fallback copy is skipped and the text box can't flush its anchor paragraph's runs"""
+    body = (
+        "<w:p><w:r><w:t>Name: Jane</w:t></w:r>"
+        + text_box(paragraph("Skills: SQL"))
+        + "<w:r><w:t xml:space=\"preserve\"> (PM)</w:t></w:r></w:p>"
+        + paragraph("Regards")
+    )
+    assert extract_text_from_docx(build_docx(body)) == "Name: Jane (PM)\nSkills: SQL\nRegards"
+
+def test_pdf_text_uses_plain_newlines_and_hyphens():
+    """PDFium's CRLFs and U+FFFE soft hyphens are normalized"""
+    with open(os.path.join(UPLOADS_DIR, "resume.pdf"), "rb") as resume:
+        text = extract_text_from_pdf(resume.read())
+    assert text
+    assert "\r" not in text and "\ufffe" not in text and "\x02" not in text
+    assert "NFC-based" in text
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\nAll {len(tests)} extractor tests PASSED!")
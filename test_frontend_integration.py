@@ -4,97 +4,111 @@ Test script to simulate frontend behavior for file processing
 This replicates the exact workflow that the frontend JavaScript performs
 """
 
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 import os
 from pathlib import Path
 
+from endpoints import BASE_URL as BACKEND_URL, JSON_HEADERS
+
 # Configuration
-BACKEND_URL = 'http://127.0.0.1:8000'
 UPLOADS_DIR = Path(__file__).parent / "uploads"
 
-def test_file_processing_workflow():
+async def check_health(client):
+    """GET /health and return the response"""
+    return await client.get('/health', timeout=10)
+
+async def extract_cover_letter(client, content):
+    """Upload the cover letter bytes to /extract_text and return the response"""
+    files = {'file': ('cover_template.txt', content, 'text/plain')}
+    return await client.post('/extract_text', files=files, timeout=10)
+
+async def test_file_processing_workflow():
     """Test the complete file processing workflow like the frontend does"""
 
     print("🚀 Testing Frontend Integration Workflow")
     print("=" * 50)
 
-    # Step 1: Test backend health
-    print("1️⃣ Testing backend health...")
-    try:
-        response = requests.get(f'{BACKEND_URL}/health', timeout=10)
-        if response.status_code == 200:
-            print(f"✅ Backend health check: {response.json()}")
-        else:
-            print(f"❌ Backend health check failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Backend connection failed: {e}")
-        return False
-
-    # Step 2: Test file text extraction
-    print("\n2️⃣ Testing file text extraction...")
     cover_letter_path = UPLOADS_DIR / "cover_template.txt"
 
     if not cover_letter_path.exists():
         print(f"❌ Cover letter file not found: {cover_letter_path}")
         return False
 
-    try:
-        with open(cover_letter_path, 'rb') as f:
-            files = {'file': ('cover_template.txt', f, 'text/plain')}
-            response = requests.post(f'{BACKEND_URL}/extract_text', files=files, timeout=10)
+    # Read the file once: the bytes are uploaded, the decoded text is sent
+    # as the subject generator's cover letter content
+    cover_letter_bytes = await asyncio.to_thread(cover_letter_path.read_bytes)
+    cover_letter_content = cover_letter_bytes.decode('utf-8')
+
+    # One client keeps a single keep-alive connection for every step
+    # retries=2 retries refused connections while the backend restarts
+    transport = httpx.AsyncHTTPTransport(retries=2)
+    async with httpx.AsyncClient(base_url=BACKEND_URL, timeout=30, transport=transport) as client:
+        # Steps 1 and 2 don't depend on each other, so they run concurrently
+        health_result, extract_result = await asyncio.gather(
+            check_health(client),
+            extract_cover_letter(client, cover_letter_bytes),
+            return_exceptions=True
+        )
+
+        # Step 1: Test backend health
+        print("1️⃣ Testing backend health...")
+        if isinstance(health_result, Exception):
+            print(f"❌ Backend connection failed: {health_result}")
+            return False
+        if health_result.status_code == 200:
+            print(f"✅ Backend health check: {orjson.loads(health_result.content)}")
+        else:
+            print(f"❌ Backend health check failed: {health_result.status_code}")
+            return False
 
-        if response.status_code == 200:
-            result = response.json()
+        # Step 2: Test file text extraction
+        print("\n2️⃣ Testing file text extraction...")
+        if isinstance(extract_result, Exception):
+            print(f"❌ Text extraction error: {extract_result}")
+            return False
+        if extract_result.status_code == 200:
+            result = orjson.loads(extract_result.content)
             print("✅ Text extraction successful:")
             print(f"   📄 Filename: {result['filename']}")
             print(f"   📏 File size: {result['file_size']} bytes")
             print(f"   📝 Content length: {len(result['text'])} characters")
             print(f"   📝 Content preview: {result['text'][:100]}...")
         else:
-            print(f"❌ Text extraction failed: {response.status_code} - {response.text}")
+            print(f"❌ Text extraction failed: {extract_result.status_code} - {extract_result.text}")
             return False
 
-    except Exception as e:
-        print(f"❌ Text extraction error: {e}")
-        return False
-
-    # Step 3: Test subject generation
-    print("\n3️⃣ Testing AI subject generation...")
-    try:
-        # Read the cover letter content
-        with open(cover_letter_path, 'r') as f:
-            cover_letter_content = f.read()
-
-        subject_payload = {
-            "job_title": "Product Manager",
-            "company": "Accelify Solutions",
-            "cover_letter_content": cover_letter_content,
-            "job_description": "Looking for experienced Product Manager with SaaS background"
-        }
-
-        response = requests.post(
-            f'{BACKEND_URL}/generate_subject',
-            json=subject_payload,
-            headers={'Content-Type': 'application/json'},
-            timeout=30
-        )
-
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ Subject generation successful:")
-            print(f"   📧 Generated subject: {result['subject']}")
-            print(f"   👤 Job title: {result['job_title']}")
-            print(f"   🏢 Company: {result['company']}")
-        else:
-            print(f"❌ Subject generation failed: {response.status_code} - {response.text}")
+        # Step 3: Test subject generation
+        print("\n3️⃣ Testing AI subject generation...")
+        try:
+            subject_payload = {
+                "job_title": "Product Manager",
+                "company": "Accelify Solutions",
+                "cover_letter_content": cover_letter_content,
+                "job_description": "Looking for experienced Product Manager with SaaS background"
+            }
+
+            response = await client.post(
+                '/generate_subject',
+                content=orjson.dumps(subject_payload),
+                headers=JSON_HEADERS
+            )
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                print("✅ Subject generation successful:")
+                print(f"   📧 Generated subject: {result['subject']}")
+                print(f"   👤 Job title: {result['job_title']}")
+                print(f"   🏢 Company: {result['company']}")
+            else:
+                print(f"❌ Subject generation failed: {response.status_code} - {response.text}")
+                return False
+
+        except Exception as e:
+            print(f"❌ Subject generation error: {e}")
             return False
 
-    except Exception as e:
-        print(f"❌ Subject generation error: {e}")
-        return False
-
     # Step 4: Test complete workflow simulation
     print("\n4️⃣ Testing complete workflow simulation...")
     try:
@@ -114,14 +128,14 @@ def main():
     print("🧪 JobAI Applier Frontend Integration Test")
     print("=" * 60)
 
-    success = test_file_processing_workflow()
+    success = asyncio.run(test_file_processing_workflow())
 
     print("\n" + "=" * 60)
     if success:
         print("🎉 ALL TESTS PASSED!")
         print("🚀 The JobAI Applier is ready for frontend use!")
         print("\n📋 Next Steps:")
-        print("1. Open frontend/index.html in your browser")
+        print("1. Run python serve_frontend.py and open http://localhost:8081")
         print("2. Upload resume and cover letter files")
         print("3. Click 'Process Documents'")
         print("4. Search for jobs and send applications")
@@ -4,12 +4,53 @@ Test script to verify Gmail SMTP credentials and sending capability
 Run this independently to test if Gmail credentials work before integrating into the main app
 """
 
+import contextlib
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email import policy
+from email.message import EmailMessage
 from dotenv import load_dotenv
 import os
 
+# Authenticated Gmail connection shared by every test in this run
+_gmail_server = None
+
+def gmail_connection(gmail_user, gmail_app_password):
+    """Return this run's authenticated Gmail SMTP connection, logging in on first use"""
+    global _gmail_server
+
+    if _gmail_server is None:
+        # Implicit TLS on 465 saves the STARTTLS round-trip of port 587
+        print("Connecting to Gmail SMTP over SSL...")
+        server = smtplib.SMTP_SSL('smtp.gmail.com', 465)
+        server.set_debuglevel(0)
+
+        print("Authenticating...")
+        try:
+            server.login(gmail_user, gmail_app_password)
+        except Exception:
+            server.close()
+            raise
+        _gmail_server = server
+    else:
+        print("Reusing authenticated Gmail SMTP connection...")
+
+    return _gmail_server
+
+@contextlib.contextmanager
+def gmail_session():
+    """Keep one Gmail connection open for the tests in the block, then close it"""
+    global _gmail_server
+    try:
+        yield
+    finally:
+        if _gmail_server is not None:
+            print("Closing connection...")
+            try:
+                _gmail_server.quit()
+            except smtplib.SMTPException:
+                _gmail_server.close()
+            _gmail_server = None
+
 def test_gmail_credentials():
     """Test Gmail SMTP authentication and sending"""
 
@@ -27,30 +68,20 @@ def test_gmail_credentials():
     print("=" * 50)
 
     try:
-        # Create a simple test email
-        msg = MIMEMultipart()
+        # Create a simple test email, serialized once with CRLF line endings
+        msg = EmailMessage(policy=policy.SMTP)
         msg['From'] = GMAIL_USER
         msg['To'] = GMAIL_USER  # Send to self for testing
         msg['Subject'] = "JobAI Applier MVP - Test Email"
 
         body = "This is a test email from JobAI Applier MVP to verify Gmail SMTP functionality."
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
+        raw_message = msg.as_bytes()
 
-        print("Connecting to Gmail SMTP...")
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-
-        print("Starting TLS encryption...")
-        server.starttls()
-
-        print("Authenticating...")
-        server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
+        server = gmail_connection(GMAIL_USER, GMAIL_APP_PASSWORD)
 
         print("Sending test email...")
-        text = msg.as_string()
-        result = server.sendmail(GMAIL_USER, [GMAIL_USER], text)
-
-        print("Closing connection...")
-        server.quit()
+        result = server.sendmail(GMAIL_USER, [GMAIL_USER], raw_message)
 
         print(f"SUCCESS: Email sent successfully! Server response: {result}")
         print(f"Test email sent from {GMAIL_USER} to {GMAIL_USER}")
@@ -93,18 +124,9 @@ def test_gmail_without_sending():
     print("=" * 50)
 
     try:
-        print("Connecting to Gmail SMTP...")
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-
-        print("Starting TLS...")
-        server.starttls()
-
-        print("Testing authentication...")
-        server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
+        gmail_connection(GMAIL_USER, GMAIL_APP_PASSWORD)
 
         print("SUCCESS: Authentication successful!")
-        print("Closing connection...")
-        server.quit()
 
         print("SUCCESS: Gmail connection test passed!")
         return True
@@ -125,12 +147,14 @@ if __name__ == "__main__":
     print("Gmail SMTP Test for JobAI Applier MVP")
     print("=" * 50)
 
-    # First test connection only
-    print("\n1. Testing Gmail connection (no email sending)...")
-    connection_ok = test_gmail_without_sending()
-
-    if connection_ok:
-        print("\n2. Testing actual email sending...")
-        test_gmail_credentials()
-    else:
-        print("\nERROR: Cannot proceed with email sending test until connection works")
\ No newline at end of file
+    # Both tests share one TLS handshake and login
+    with gmail_session():
+        # First test connection only
+        print("\n1. Testing Gmail connection (no email sending)...")
+        connection_ok = test_gmail_without_sending()
+
+        if connection_ok:
+            print("\n2. Testing actual email sending...")
+            test_gmail_credentials()
+        else:
+            print("\nERROR: Cannot proceed with email sending test until connection works")
\ No newline at end of file
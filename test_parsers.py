@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script for the Gemini response parsers (no server or API key needed)
+Run with pytest or directly: python test_parsers.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from main import JsonArrayScanner, extract_json_array
+
+STREAMED_ARRAY = (
+    'Here you go:\n```json\n'
+    '[{"company": "Acme [India]", "title": "PM", "description": "Owns the \\"roadmap\\" {v2}"},'
+    ' {"company": "Beta Labs", "title": "Analyst", "description": "SQL, Python"}]\n'
+    '```\nLet me know if you need more [examples].'
+)
+
+def scan_in_chunks(text, size):
+    """Feed text to a fresh scanner in fixed-size chunks and collect every object."""
+    scanner = JsonArrayScanner()
+    objects = []
+    for i in range(0, len(text), size):
+        objects.extend(scanner.feed(text[i:i + size]))
+    return objects
+
+def test_scanner_splits_array_for_every_chunk_size():
+    """Brackets, braces and escaped quotes inside strings must not confuse the scanner"""
+    expected = [
+        '{"company": "Acme [India]", "title": "PM", "description": "Owns the \\"roadmap\\" {v2}"}',
+        '{"company": "Beta Labs", "title": "Analyst", "description": "SQL, Python"}',
+    ]
+    for size in range(1, len(STREAMED_ARRAY) + 1):
+        assert scan_in_chunks(STREAMED_ARRAY, size) == expected, f"chunk size {size}"
+
+def test_scanner_emits_objects_before_array_closes():
+    """The first job is available as soon as its object closes"""
+    scanner = JsonArrayScanner()
+    assert scanner.feed('[{"company": "A"}, {"comp') == ['{"company": "A"}']
+    assert scanner.feed('any": "B"}') == ['{"company": "B"}']
+    assert scanner.feed(']') == []
+
+def test_scanner_returns_nested_objects_whole():
+    """Batch entries contain a nested jobs array; only top-level elements are emitted"""
+    text = '[{"index": 0, "jobs": [{"company": "A"}, {"company": "B"}]}, {"index": 1, "jobs": []}]'
+    assert scan_in_chunks(text, 5) == [
+        '{"index": 0, "jobs": [{"company": "A"}, {"company": "B"}]}',
+        '{"index": 1, "jobs": []}',
+    ]
+
+def test_extract_json_array_ignores_surrounding_prose():
+    """Leading "[...]" prose and trailing brackets around the real array are skipped"""
+    jobs = extract_json_array(STREAMED_ARRAY)
+    assert [job["company"] for job in jobs] == ["Acme [India]", "Beta Labs"]
+
+def test_extract_json_array_skips_bracketed_non_object_arrays():
+    """A footnote like "[1]" before the postings is valid JSON but not the answer"""
+    assert extract_json_array('See [1] and [Note]: [{"a": 1}]') == [{"a": 1}]
+
+def test_extract_json_array_plain():
+    assert extract_json_array('[{"a": 1}]') == [{"a": 1}]
+
+def test_extract_json_array_without_array_raises():
+    for text in ["", "no json here", "[not json", '{"a": [}']:
+        try:
+            extract_json_array(text)
+        except ValueError:
+            continue
+        raise AssertionError(f"expected ValueError for {text!r}")
+
+if __name__ == "__main__":
+    tests = [value for name, value in sorted(globals().items()) if name.startswith("test_")]
+    for test in tests:
+        test()
+        print(f"✅ {test.__name__}")
+    print(f"\nAll {len(tests)} parser tests PASSED!")